@@ -0,0 +1,18 @@
+"""Production entrypoint: ``python -m app`` from the backend directory."""
+
+import os
+
+import uvicorn
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "app.main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        # Threads, attachments and project state live in process memory, so
+        # extra workers would each see a different store; keep one by default
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
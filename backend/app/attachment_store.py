@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
 import mimetypes
 import os
+import secrets
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, BinaryIO
 
-from chatkit.store import AttachmentStore
+from chatkit.store import AttachmentStore, NotFoundError
 from chatkit.types import (
     Attachment,
     AttachmentCreateParams,
@@ -15,9 +19,70 @@ from chatkit.types import (
     FileAttachment,
     ImageAttachment,
 )
+from openai import AsyncOpenAI
 
 from .memory_store import MemoryStore
 
+logger = logging.getLogger(__name__)
+
+# Read once at import; main.py loads .env before importing this module
+PUBLIC_URL = os.environ.get("PUBLIC_URL", "").rstrip("/") or None
+
+# Common upload types resolved without going through the mimetypes registry
+_FAST_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".pdf": "application/pdf",
+}
+
+# Streamed uploads are flushed to disk in writes of about this size
+_STREAM_WRITE_SIZE = 1024 * 1024
+
+# Above this size a turn waits for the Files API upload instead of inlining
+# base64; smaller files encode faster than the upload round trip
+_LARGE_ATTACHMENT_SIZE = 2 * 1024 * 1024
+
+# Load the system mime.types now rather than on the first upload
+mimetypes.init()
+
+
+def _storage_path(attachment: Attachment) -> str:
+    path = (attachment.metadata or {}).get("path")
+    if not path:
+        raise RuntimeError(f"Attachment {attachment.id} has no storage path")
+    return path
+
+
+def _write_and_hash(f: BinaryIO, hasher: Any, data: bytearray) -> None:
+    f.write(data)
+    hasher.update(data)
+
+
+def _write_file(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _content_digest(data: bytes) -> str:
+    """Hash upload bytes for dedup; hashlib releases the GIL on large buffers."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _upload_purpose(attachment: Attachment) -> str:
+    return "vision" if isinstance(attachment, ImageAttachment) else "user_data"
+
 
 class LocalAttachmentStore(AttachmentStore[dict[str, Any]]):
     """Save attachments on disk and return local upload/preview URLs."""
@@ -26,6 +91,17 @@ class LocalAttachmentStore(AttachmentStore[dict[str, Any]]):
         self.store = store
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._openai: AsyncOpenAI | None = None
+        # attachment id -> in-flight Files API upload; also holds references
+        # so fire-and-forget uploads aren't garbage collected
+        self._upload_tasks: dict[str, asyncio.Task[None]] = {}
+        # (content digest, purpose) -> OpenAI file id, so repeated uploads of
+        # the same bytes reuse one remote file
+        self._content_index: dict[tuple[str, str], str] = {}
+
+    def generate_attachment_id(self, mime_type: str, context: dict[str, Any]) -> str:
+        """Return a short random id (96 bits) without building a UUID object."""
+        return f"atc_{secrets.token_urlsafe(12)}"
 
     async def create_attachment(
         self, input: AttachmentCreateParams, context: dict[str, Any]
@@ -35,7 +111,8 @@ class LocalAttachmentStore(AttachmentStore[dict[str, Any]]):
         path = self.base_dir / f"{attachment_id}_{filename}"
         mime_type = input.mime_type or ""
         if not mime_type or mime_type == "application/octet-stream":
-            guessed, _ = mimetypes.guess_type(filename)
+            ext = os.path.splitext(filename)[1].lower()
+            guessed = _FAST_MIME.get(ext) or mimetypes.guess_type(filename)[0]
             if guessed:
                 mime_type = guessed
         # Upload URL uses local backend (frontend can access localhost)
@@ -74,21 +151,175 @@ class LocalAttachmentStore(AttachmentStore[dict[str, Any]]):
     async def delete_attachment(self, attachment_id: str, context: dict[str, Any]) -> None:
         attachment = await self.store.load_attachment(attachment_id, context=context)
         path = (attachment.metadata or {}).get("path")
-        if path and Path(path).exists():
-            Path(path).unlink(missing_ok=True)
+        if path:
+            await asyncio.to_thread(_remove_file, path)
 
     async def save_upload(
         self, attachment_id: str, data: bytes, context: dict[str, Any]
     ) -> Attachment:
         attachment = await self.store.load_attachment(attachment_id, context=context)
-        path = (attachment.metadata or {}).get("path")
-        if not path:
-            raise RuntimeError(f"Attachment {attachment_id} has no storage path")
-        Path(path).write_bytes(data)
-        updated = attachment.model_copy(update={"upload_descriptor": None})
+        path = _storage_path(attachment)
+        await asyncio.to_thread(_write_file, path, data)
+        digest = await asyncio.to_thread(_content_digest, data)
+        return await self._finish_upload(attachment, digest, context)
+
+    async def save_stream(
+        self,
+        attachment_id: str,
+        chunks: AsyncIterator[bytes],
+        context: dict[str, Any],
+    ) -> Attachment:
+        """Like save_upload, but writes the body to disk as it arrives.
+
+        Chunks are coalesced into ~1 MiB writes and hashed incrementally, so
+        memory use stays flat regardless of upload size. Raises ValueError
+        for an empty body.
+        """
+        attachment = await self.store.load_attachment(attachment_id, context=context)
+        path = _storage_path(attachment)
+        hasher = hashlib.blake2b(digest_size=16)
+        size = 0
+        buffer = bytearray()
+        # Write beside the target and rename on success, so an aborted or
+        # empty upload never clobbers a previously stored file
+        part_path = f"{path}.part"
+        f = await asyncio.to_thread(open, part_path, "wb")
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                if len(buffer) >= _STREAM_WRITE_SIZE:
+                    await asyncio.to_thread(_write_and_hash, f, hasher, buffer)
+                    size += len(buffer)
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(_write_and_hash, f, hasher, buffer)
+                size += len(buffer)
+        except BaseException:
+            await asyncio.to_thread(f.close)
+            await asyncio.to_thread(_remove_file, part_path)
+            raise
+        await asyncio.to_thread(f.close)
+
+        if size == 0:
+            await asyncio.to_thread(_remove_file, part_path)
+            raise ValueError("Empty upload body")
+        await asyncio.to_thread(os.replace, part_path, path)
+        return await self._finish_upload(attachment, hasher.hexdigest(), context)
+
+    async def _finish_upload(
+        self, attachment: Attachment, digest: str, context: dict[str, Any]
+    ) -> Attachment:
+        """Record the stored file's digest and kick off the Files API upload."""
+        metadata = {**(attachment.metadata or {}), "sha": digest}
+        file_id = self._content_index.get((digest, _upload_purpose(attachment)))
+        if file_id:
+            metadata["openai_file_id"] = file_id
+        updated = attachment.model_copy(
+            update={"upload_descriptor": None, "metadata": metadata}
+        )
         await self.store.save_attachment(updated, context=context)
+        if file_id:
+            return updated
+
+        # Upload to the OpenAI Files API in the background so later turns can
+        # reference the file by id instead of inlining base64
+        self._start_upload(attachment.id, context)
         return updated
 
+    def _start_upload(
+        self, attachment_id: str, context: dict[str, Any]
+    ) -> asyncio.Task[None]:
+        """Start a background Files API upload, or return the one in flight."""
+        task = self._upload_tasks.get(attachment_id)
+        if task is None:
+            task = asyncio.create_task(self._upload_to_openai(attachment_id, context))
+            self._upload_tasks[attachment_id] = task
+            task.add_done_callback(
+                lambda done: self._upload_tasks.get(attachment_id) is done
+                and self._upload_tasks.pop(attachment_id)
+            )
+        return task
+
+    async def ensure_file_reference(
+        self, attachment: Attachment, context: dict[str, Any]
+    ) -> Attachment:
+        """Return the attachment with its openai_file_id once a large file is uploaded.
+
+        A turn that arrives before the background upload finished waits for
+        it (or restarts it after a failure) so big files are referenced by id
+        rather than inlined as base64. Small files and failed uploads come
+        back unchanged and are inlined.
+        """
+        metadata = attachment.metadata or {}
+        path = metadata.get("path")
+        if not path or metadata.get("openai_file_id"):
+            return attachment
+
+        # Thread items carry a snapshot; the stored record may already have
+        # the id from an upload that finished since
+        file_id = await self._stored_file_id(attachment.id, context)
+        if file_id is None:
+            try:
+                size = await asyncio.to_thread(os.path.getsize, path)
+            except OSError:
+                return attachment
+            if size < _LARGE_ATTACHMENT_SIZE:
+                return attachment
+            # Shielded so a cancelled turn doesn't abort the shared upload
+            await asyncio.shield(self._start_upload(attachment.id, context))
+            file_id = await self._stored_file_id(attachment.id, context)
+            if file_id is None:
+                return attachment
+        return attachment.model_copy(
+            update={"metadata": {**metadata, "openai_file_id": file_id}}
+        )
+
+    async def _stored_file_id(
+        self, attachment_id: str, context: dict[str, Any]
+    ) -> str | None:
+        try:
+            stored = await self.store.load_attachment(attachment_id, context=context)
+        except NotFoundError:
+            return None
+        return (stored.metadata or {}).get("openai_file_id")
+
+    async def _upload_to_openai(self, attachment_id: str, context: dict[str, Any]) -> None:
+        """Upload a stored attachment to OpenAI and record its file_id in metadata."""
+        try:
+            attachment = await self.store.load_attachment(attachment_id, context=context)
+            path = (attachment.metadata or {}).get("path")
+            if not path:
+                return
+            purpose = _upload_purpose(attachment)
+            if self._openai is None:
+                self._openai = AsyncOpenAI()
+            uploaded = await self._openai.files.create(file=Path(path), purpose=purpose)
+        except Exception:
+            logger.warning("OpenAI file upload failed for %s", attachment_id, exc_info=True)
+            return
+
+        digest = (attachment.metadata or {}).get("sha")
+        if digest:
+            self._content_index[(digest, purpose)] = uploaded.id
+
+        # Reload in case the attachment changed while the upload was in flight
+        try:
+            attachment = await self.store.load_attachment(attachment_id, context=context)
+        except NotFoundError:
+            return
+        metadata = {**(attachment.metadata or {}), "openai_file_id": uploaded.id}
+        await self.store.save_attachment(
+            attachment.model_copy(update={"metadata": metadata}), context=context
+        )
+
+    async def aclose(self) -> None:
+        """Wait for in-flight Files API uploads and close the OpenAI client."""
+        if self._upload_tasks:
+            await asyncio.gather(*self._upload_tasks.values(), return_exceptions=True)
+        if self._openai is not None:
+            await self._openai.close()
+            self._openai = None
+
     def _build_local_url(self, context: dict[str, Any], path: str) -> str:
         """Build URL using request origin (for uploads from frontend)."""
         request = context.get("request")
@@ -99,8 +330,7 @@ class LocalAttachmentStore(AttachmentStore[dict[str, Any]]):
 
     def _build_public_url(self, context: dict[str, Any], path: str) -> str:
         """Build URL using PUBLIC_URL env var (for ChatKit iframe previews)."""
-        public_url = os.environ.get("PUBLIC_URL")
-        if public_url:
-            return f"{public_url.rstrip('/')}{path}"
+        if PUBLIC_URL:
+            return f"{PUBLIC_URL}{path}"
         # Fall back to local URL if no PUBLIC_URL set
         return self._build_local_url(context, path)
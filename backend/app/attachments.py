@@ -2,20 +2,42 @@
 
 from __future__ import annotations
 
-import base64
-from pathlib import Path
-
+import asyncio
+import itertools
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterator
+
+import pybase64
 from chatkit.types import Attachment, ImageAttachment
-from openai.types.responses import ResponseInputContentParam, ResponseInputFileParam
-from openai.types.responses import ResponseInputImageParam, ResponseInputTextParam
+from openai.types.responses import ResponseInputContentParam
+
+logger = logging.getLogger(__name__)
+# Record which SIMD code path pybase64 dispatches to (absent without the C extension)
+if hasattr(pybase64, "_get_simd_path"):
+    logger.debug(
+        "pybase64 %s: SIMD path %s, compiled flags %#x, runtime flags %#x",
+        pybase64.get_version(),
+        pybase64._get_simd_name(pybase64._get_simd_path()),
+        pybase64._get_simd_flags_compile(),
+        pybase64._get_simd_flags_runtime(),
+    )
+else:
+    logger.debug("pybase64 %s: no SIMD acceleration", pybase64.get_version())
 
+# Read 3-byte-aligned, L2-sized chunks so large files never sit in memory whole
+_B64_CHUNK_SIZE = 3 * 256 * 1024
+# Below this size a single read+encode beats the chunked join
+_B64_INLINE_THRESHOLD = 64 * 1024
 
-def _read_attachment_bytes(attachment: Attachment) -> bytes:
-    metadata = attachment.metadata or {}
-    path = metadata.get("path")
-    if not path:
-        raise RuntimeError(f"Attachment {attachment.id} has no stored path")
-    return Path(path).read_bytes()
+# LRU of encoded payloads keyed by (attachment id, mtime_ns, size), bounded
+# by the total length of the cached strings (ASCII, so length == bytes)
+_ENCODED_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_ENCODED_CACHE: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_ENCODED_CACHE_LOCK = threading.Lock()
+_encoded_cache_bytes = 0
 
 
 def _get_attachment_path(attachment: Attachment) -> str | None:
@@ -24,6 +46,81 @@ def _get_attachment_path(attachment: Attachment) -> str | None:
     return metadata.get("path")
 
 
+def _iter_b64_chunks(path: str, chunk: int = _B64_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the base64 encoding of a file one chunk at a time.
+
+    `chunk` must be a multiple of 3 so only the final piece carries padding.
+    """
+    with open(path, "rb") as f:
+        while data := f.read(chunk):
+            yield pybase64.b64encode(data)
+
+
+def _encode_to_data_uri(path: str, mime: str | None, size: int) -> str:
+    """Base64-encode a file, prefixed as a data URI when mime is given.
+
+    Encoded chunks are copied straight into a buffer preallocated to the
+    final length, so each chunk is freed as soon as it is written and only
+    the buffer and the returned str are ever alive together.
+    """
+    prefix = f"data:{mime};base64,".encode("ascii") if mime else b""
+    if size < _B64_INLINE_THRESHOLD:
+        with open(path, "rb") as f:
+            return (prefix + pybase64.b64encode(f.read())).decode("ascii")
+
+    buf = bytearray(len(prefix) + 4 * ((size + 2) // 3))
+    view = memoryview(buf)
+    view[: len(prefix)] = prefix
+    offset = len(prefix)
+    for chunk in _iter_b64_chunks(path):
+        view[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    view.release()
+    # The file may have shrunk between stat() and read
+    del buf[offset:]
+    return buf.decode("ascii")
+
+
+def _encode_attachment(attachment: Attachment) -> str:
+    """Base64-encode the stored file for an attachment.
+
+    Images come back as a complete data URI, other files as bare base64.
+    Results are cached by (id, mtime, size) so repeat turns skip the work.
+    """
+    path = _get_attachment_path(attachment)
+    if not path:
+        raise RuntimeError(f"Attachment {attachment.id} has no stored path")
+    st = os.stat(path)
+    key = (attachment.id, st.st_mtime_ns, st.st_size)
+    with _ENCODED_CACHE_LOCK:
+        cached = _ENCODED_CACHE.get(key)
+        if cached is not None:
+            _ENCODED_CACHE.move_to_end(key)
+            return cached
+
+    mime = attachment.mime_type if isinstance(attachment, ImageAttachment) else None
+    encoded = _encode_to_data_uri(path, mime, st.st_size)
+
+    _cache_encoded(key, encoded)
+    return encoded
+
+
+def _cache_encoded(key: tuple[str, int, int], encoded: str) -> None:
+    """Store an encoded payload, evicting the oldest ones to stay within budget."""
+    global _encoded_cache_bytes
+    if len(encoded) > _ENCODED_CACHE_MAX_BYTES:
+        return
+    with _ENCODED_CACHE_LOCK:
+        previous = _ENCODED_CACHE.pop(key, None)
+        if previous is not None:
+            _encoded_cache_bytes -= len(previous)
+        _ENCODED_CACHE[key] = encoded
+        _encoded_cache_bytes += len(encoded)
+        while _encoded_cache_bytes > _ENCODED_CACHE_MAX_BYTES:
+            _, evicted = _ENCODED_CACHE.popitem(last=False)
+            _encoded_cache_bytes -= len(evicted)
+
+
 def attachment_to_message_contents(
     attachment: Attachment,
 ) -> list[ResponseInputContentParam]:
@@ -33,8 +130,6 @@ def attachment_to_message_contents(
     - A text part with file path info (so agent can reference the file)
     - The actual file/image content
     """
-    raw = _read_attachment_bytes(attachment)
-    encoded = base64.b64encode(raw).decode("ascii")
     path = _get_attachment_path(attachment)
 
     parts: list[ResponseInputContentParam] = []
@@ -42,50 +137,55 @@ def attachment_to_message_contents(
     # Add path info as text so agent knows how to reference it in storyboard
     if path:
         parts.append(
-            ResponseInputTextParam(
-                type="input_text",
-                text=f"[Attached file: {attachment.name}, path: {path}]",
-            )
-        )
-
-    if isinstance(attachment, ImageAttachment):
-        parts.append(
-            ResponseInputImageParam(
-                type="input_image",
-                detail="auto",
-                image_url=f"data:{attachment.mime_type};base64,{encoded}",
-            )
-        )
-    else:
-        parts.append(
-            ResponseInputFileParam(
-                type="input_file",
-                file_data=encoded,
-                filename=attachment.name,
-            )
+            {
+                "type": "input_text",
+                "text": f"[Attached file: {attachment.name}, path: {path}]",
+            }
         )
 
+    parts.append(attachment_to_message_content(attachment))
     return parts
 
 
+async def attachments_to_message_contents(
+    attachments: list[Attachment],
+) -> list[ResponseInputContentParam]:
+    """Convert several attachments concurrently, preserving their order.
+
+    Each attachment is read and encoded in a worker thread so disk I/O and
+    base64 encoding overlap across files instead of running back to back.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(attachment_to_message_contents, a) for a in attachments)
+    )
+    return list(itertools.chain.from_iterable(results))
+
+
 def attachment_to_message_content(attachment: Attachment) -> ResponseInputContentParam:
     """Convert an attachment into a single Responses API input content part.
 
+    Parts are built as plain dict literals; the SDK param types are TypedDicts
+    so there is nothing to validate. Uses the OpenAI file_id when the
+    background upload has finished and falls back to inline base64 otherwise.
+
     Note: This doesn't include path info. Use attachment_to_message_contents()
     if you need the path for the agent to reference.
     """
-    raw = _read_attachment_bytes(attachment)
-    encoded = base64.b64encode(raw).decode("ascii")
+    file_id = (attachment.metadata or {}).get("openai_file_id")
 
     if isinstance(attachment, ImageAttachment):
-        return ResponseInputImageParam(
-            type="input_image",
-            detail="auto",
-            image_url=f"data:{attachment.mime_type};base64,{encoded}",
-        )
-
-    return ResponseInputFileParam(
-        type="input_file",
-        file_data=encoded,
-        filename=attachment.name,
-    )
+        if file_id:
+            return {"type": "input_image", "detail": "auto", "file_id": file_id}
+        return {
+            "type": "input_image",
+            "detail": "auto",
+            "image_url": _encode_attachment(attachment),
+        }
+
+    if file_id:
+        return {"type": "input_file", "file_id": file_id}
+    return {
+        "type": "input_file",
+        "file_data": _encode_attachment(attachment),
+        "filename": attachment.name,
+    }
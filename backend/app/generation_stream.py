@@ -0,0 +1,145 @@
+"""Push video generation status updates to streaming (SSE) subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator
+
+from .integrations.video_generation import GeneratedVideo, VideoGenerationService
+from .tools.video_generations import VideoGenerations, poll_and_save_video_generations
+
+logger = logging.getLogger(__name__)
+
+
+def _video_key(video: GeneratedVideo) -> tuple[object, ...]:
+    """Fields whose change is worth pushing to subscribers."""
+    return (video.status, video.progress, video.video_url, video.error)
+
+
+class GenerationStatusHub:
+    """Track submitted projects and fan out status changes to subscribers.
+
+    Each project has at most one polling task no matter how many clients are
+    listening. It runs only while someone is subscribed, backs off while
+    nothing changes, and stops once no video is still in progress.
+    """
+
+    MAX_PROJECTS = 1024
+
+    def __init__(
+        self,
+        project_root: Path,
+        service: VideoGenerationService,
+        poll_interval: float = 2.0,
+        max_interval: float = 15.0,
+    ) -> None:
+        self._project_root = project_root
+        self._service = service
+        self._poll_interval = poll_interval
+        self._max_interval = max_interval
+        # project_id -> latest known generations, LRU-bounded
+        self._projects: OrderedDict[str, VideoGenerations] = OrderedDict()
+        self._subscribers: dict[str, set[asyncio.Queue[GeneratedVideo | None]]] = {}
+        self._pollers: dict[str, asyncio.Task[None]] = {}
+
+    def update(self, generations: VideoGenerations) -> None:
+        """Record the latest state of a project (on submit or legacy poll)."""
+        self._projects[generations.project_id] = generations
+        self._projects.move_to_end(generations.project_id)
+        while len(self._projects) > self.MAX_PROJECTS:
+            self._projects.popitem(last=False)
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._projects
+
+    async def subscribe(self, project_id: str) -> AsyncIterator[GeneratedVideo]:
+        """Yield every video once, then each change until the project settles."""
+        generations = self._projects[project_id]
+        if generations.status != "in_progress":
+            for segment in generations.segments:
+                for result in segment.generation_results:
+                    yield result.video
+            return
+
+        # Register before yielding the snapshot so changes published while
+        # the consumer reads it are queued rather than missed
+        queue: asyncio.Queue[GeneratedVideo | None] = asyncio.Queue()
+        self._subscribers.setdefault(project_id, set()).add(queue)
+        poller = self._pollers.get(project_id)
+        if poller is None or poller.done():
+            poller = asyncio.create_task(self._poll(project_id))
+            self._pollers[project_id] = poller
+            poller.add_done_callback(
+                lambda task: self._pollers.get(project_id) is task
+                and self._pollers.pop(project_id)
+            )
+        try:
+            for segment in generations.segments:
+                for result in segment.generation_results:
+                    yield result.video
+            while (video := await queue.get()) is not None:
+                yield video
+        finally:
+            subscribers = self._subscribers.get(project_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[project_id]
+                    # Popped so a subscriber arriving before the task unwinds
+                    # starts a fresh poller instead of reusing this one
+                    poller = self._pollers.pop(project_id, None)
+                    if poller is not None:
+                        poller.cancel()
+
+    def _publish(self, project_id: str, item: GeneratedVideo | None) -> None:
+        for queue in self._subscribers.get(project_id, ()):
+            queue.put_nowait(item)
+
+    async def _poll(self, project_id: str) -> None:
+        """Poll one project with backoff, publishing videos whose status changed."""
+        interval = self._poll_interval
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                previous = self._projects.get(project_id)
+                if previous is None:
+                    break
+                current = await poll_and_save_video_generations(
+                    previous, self._project_root, service=self._service
+                )
+                self.update(current)
+
+                changed = False
+                for old_segment, new_segment in zip(previous.segments, current.segments):
+                    for old, new in zip(
+                        old_segment.generation_results, new_segment.generation_results
+                    ):
+                        if _video_key(old.video) != _video_key(new.video):
+                            self._publish(project_id, new.video)
+                            changed = True
+
+                if current.status != "in_progress":
+                    break
+                interval = (
+                    self._poll_interval
+                    if changed
+                    else min(interval * 1.5, self._max_interval)
+                )
+        except Exception:
+            logger.exception("Status polling failed for project %s", project_id)
+        finally:
+            # Ends every open stream, including on shutdown, unless a newer
+            # poller has taken over the project's subscribers
+            current = asyncio.current_task()
+            if self._pollers.get(project_id, current) is current:
+                self._publish(project_id, None)
+
+    async def aclose(self) -> None:
+        """Stop all polling tasks."""
+        pollers = list(self._pollers.values())
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
@@ -1,8 +1,13 @@
 """Abstract base class for video generation providers."""
 
 import asyncio
+import random
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, TypeVar
 
 from ..exceptions import VideoGenerationTimeoutError
 from ..types import GeneratedVideo, GenerationConfig, VideoGenerationInput
@@ -10,11 +15,58 @@ from ..types import GeneratedVideo, GenerationConfig, VideoGenerationInput
 T = TypeVar("T", bound=VideoGenerationInput)
 
 
+# Word-bounded so e.g. "1403" inside a URL doesn't count as an auth failure
+_AUTH_RE = re.compile(r"\b(?:401|403)\b|authentication|unauthoriz", re.IGNORECASE)
+
+
+def is_auth_error(exc: BaseException) -> bool:
+    """Whether an SDK/provider exception signals bad or missing credentials."""
+    # google-genai APIError (and most HTTP errors) carry the status code
+    if getattr(exc, "code", None) in (401, 403):
+        return True
+    return _AUTH_RE.search(str(exc)) is not None
+
+
+_last_iso_ns = 0
+_last_iso = ""
+
+
+def iso_now() -> str:
+    """Current UTC time as ISO 8601, reusing the string within the same millisecond."""
+    global _last_iso_ns, _last_iso
+    now_ns = time.monotonic_ns()
+    if now_ns - _last_iso_ns >= 1_000_000 or not _last_iso:
+        _last_iso = datetime.now(tz=timezone.utc).isoformat()
+        _last_iso_ns = now_ns
+    return _last_iso
+
+
+def nearest_duration_map(supported: tuple[int, ...], max_duration: int = 30) -> dict[int, int]:
+    """Precompute the closest supported duration for every second up to max_duration."""
+    return {
+        duration: min(supported, key=lambda x: abs(x - duration))
+        for duration in range(max_duration + 1)
+    }
+
+
 class VideoProvider(ABC):
     """Abstract base class for video generation providers."""
 
     provider_name: str = "base"
 
+    # Backoff schedule for wait_for_completion
+    POLL_BACKOFF = 1.5
+    MAX_POLL_INTERVAL = 10.0
+
+    # Completed statuses never change, so the most recent ones are kept
+    MAX_COMPLETED_CACHE = 1024
+
+    def __init__(self) -> None:
+        # video_id -> status request currently on the wire
+        self._inflight: dict[str, asyncio.Task[GeneratedVideo]] = {}
+        # video_id -> completed status (LRU)
+        self._completed: OrderedDict[str, GeneratedVideo] = OrderedDict()
+
     @abstractmethod
     async def generate(
         self,
@@ -63,19 +115,89 @@ class VideoProvider(ABC):
         """
         ...
 
+    async def get_status_many(
+        self, video_ids: list[str]
+    ) -> list[GeneratedVideo | BaseException]:
+        """
+        Get the status of several videos concurrently.
+
+        Args:
+            video_ids: The provider's video identifiers
+
+        Returns:
+            One entry per id, in order; lookups that raised are returned as
+            the exception instead of aborting the others
+        """
+        return await asyncio.gather(
+            *(self.get_status(video_id) for video_id in video_ids),
+            return_exceptions=True,
+        )
+
+    async def _single_flight(
+        self,
+        video_id: str,
+        fetch: Callable[[str], Awaitable[GeneratedVideo]],
+    ) -> GeneratedVideo:
+        """Share one in-flight status request among concurrent callers.
+
+        Completed statuses are served from memory without a request, which
+        also makes get_video_url after a completed poll free. A caller being
+        cancelled does not cancel the request for the others.
+        """
+        cached = self._completed.get(video_id)
+        if cached is not None:
+            self._completed.move_to_end(video_id)
+            return cached
+
+        task = self._inflight.get(video_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_remember(video_id, fetch))
+            self._inflight[video_id] = task
+
+            def _done(t: asyncio.Task[GeneratedVideo]) -> None:
+                if self._inflight.get(video_id) is t:
+                    del self._inflight[video_id]
+                if not t.cancelled():
+                    # Mark the exception retrieved in case every waiter left
+                    t.exception()
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _fetch_and_remember(
+        self,
+        video_id: str,
+        fetch: Callable[[str], Awaitable[GeneratedVideo]],
+    ) -> GeneratedVideo:
+        video = await fetch(video_id)
+        if video.status == "completed":
+            self._completed[video_id] = video
+            self._completed.move_to_end(video_id)
+            if len(self._completed) > self.MAX_COMPLETED_CACHE:
+                self._completed.popitem(last=False)
+        return video
+
+    async def aclose(self) -> None:
+        """Release any network resources held by the provider."""
+        return None
+
     async def wait_for_completion(
         self,
         video_id: str,
-        poll_interval: float = 5.0,
+        poll_interval: float = 1.0,
         timeout: float = 600.0,
+        max_interval: float | None = None,
     ) -> GeneratedVideo:
         """
-        Wait for video generation to complete, polling periodically.
+        Wait for video generation to complete, polling with exponential backoff.
 
         Args:
             video_id: The provider's unique video identifier
-            poll_interval: Seconds between status checks (default: 5.0)
+            poll_interval: Initial seconds between status checks (default: 1.0).
+                Grows by POLL_BACKOFF per poll up to max_interval, with
+                ±10% jitter so concurrent waiters don't poll in lockstep.
             timeout: Maximum seconds to wait (default: 600.0 = 10 minutes)
+            max_interval: Cap on the poll interval (default: MAX_POLL_INTERVAL)
 
         Returns:
             GeneratedVideo with final status (completed or failed)
@@ -84,6 +206,8 @@ class VideoProvider(ABC):
             VideoGenerationTimeoutError: If timeout is reached
         """
         elapsed = 0.0
+        interval = poll_interval
+        cap = max_interval or self.MAX_POLL_INTERVAL
 
         while elapsed < timeout:
             status = await self.get_status(video_id)
@@ -91,8 +215,10 @@ class VideoProvider(ABC):
             if status.status in ("completed", "failed"):
                 return status
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            delay = interval * random.uniform(0.9, 1.1)
+            await asyncio.sleep(delay)
+            elapsed += delay
+            interval = min(interval * self.POLL_BACKOFF, cap)
 
         raise VideoGenerationTimeoutError(
             provider=self.provider_name,
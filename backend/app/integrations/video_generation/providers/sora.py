@@ -1,11 +1,15 @@
 """Sora (OpenAI) video generation provider implementation."""
 
-import base64
+import asyncio
 import os
+import random
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
+import pybase64
 
 from ..exceptions import (
     InvalidConfigurationError,
@@ -14,7 +18,12 @@ from ..exceptions import (
     VideoNotFoundError,
 )
 from ..types import GeneratedVideo, GenerationConfig, ImageInput, SoraInput
-from .base import VideoProvider
+from .base import VideoProvider, iso_now, nearest_duration_map
+
+
+def _json(response: httpx.Response) -> Any:
+    """Parse a response body with orjson instead of httpx's stdlib json."""
+    return orjson.loads(response.content)
 
 
 class SoraProvider(VideoProvider):
@@ -30,7 +39,14 @@ class SoraProvider(VideoProvider):
     }
 
     # Sora supports these durations
-    SUPPORTED_DURATIONS = [4, 8, 12]
+    SUPPORTED_DURATIONS = (4, 8, 12)
+    _DURATION_MAP = nearest_duration_map(SUPPORTED_DURATIONS)
+
+    # Status lookups answered with these are retried a few times with a
+    # short backoff; the transport's own retries only cover connect errors
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    STATUS_RETRIES = 2
+    RETRY_DELAY = 0.5
 
     def __init__(self, api_key: str | None = None):
         """
@@ -39,36 +55,58 @@ class SoraProvider(VideoProvider):
         Args:
             api_key: OpenAI API key. If not provided, uses OPENAI_API_KEY env var.
         """
+        super().__init__()
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
             raise ProviderAuthenticationError(
                 "sora", "OPENAI_API_KEY environment variable not set"
             )
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use.
+
+        Reusing one pooled client avoids a TCP+TLS handshake on every poll.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=httpx.Timeout(30.0),
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=2,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=20, max_connections=100
+                    ),
+                ),
+            )
+        return self._client
 
-    def _get_headers(self, content_type: str = "application/json") -> dict[str, str]:
-        """Get HTTP headers for API requests."""
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        if content_type:
-            headers["Content-Type"] = content_type
-        return headers
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-    def _get_size(self, config: GenerationConfig) -> str:
+    @classmethod
+    def _get_size(cls, config: GenerationConfig) -> str:
         """Convert aspect_ratio and resolution to Sora size string."""
-        key = (config.aspect_ratio, config.resolution)
-        if key not in self.SIZE_MAP:
+        size = cls.SIZE_MAP.get((config.aspect_ratio, config.resolution))
+        if size is None:
             raise InvalidConfigurationError(
                 "sora",
                 f"Unsupported aspect_ratio/resolution combination: {config.aspect_ratio}/{config.resolution}",
             )
-        return self.SIZE_MAP[key]
+        return size
 
     def _validate_duration(self, duration: int) -> int:
         """Validate and return duration for Sora."""
-        if duration not in self.SUPPORTED_DURATIONS:
-            # Find closest supported duration
+        closest = self._DURATION_MAP.get(duration)
+        if closest is None:
+            # Outside the precomputed range - find closest supported duration
             closest = min(self.SUPPORTED_DURATIONS, key=lambda x: abs(x - duration))
-            return closest
-        return duration
+        return closest
 
     def _build_image_input(self, image: ImageInput) -> dict[str, Any]:
         """Build image input for Sora API."""
@@ -89,7 +127,7 @@ class SoraProvider(VideoProvider):
         if isinstance(created_at, int):
             created_at = datetime.fromtimestamp(created_at, tz=timezone.utc).isoformat()
         elif not created_at:
-            created_at = datetime.now(tz=timezone.utc).isoformat()
+            created_at = iso_now()
 
         # Build video URL if completed
         video_url = None
@@ -131,132 +169,146 @@ class SoraProvider(VideoProvider):
         size = self._get_size(config)
         duration = self._validate_duration(config.duration)
 
-        async with httpx.AsyncClient() as client:
-            # Check if we have an input image - use multipart form data
-            if input_data.input_image:
-                # Build multipart form data
-                form_data = {
-                    "model": input_data.model or "sora-2",
-                    "prompt": input_data.prompt,
-                    "size": size,
-                    "seconds": str(duration),
+        client = self._get_client()
+        # Check if we have an input image - use multipart form data
+        if input_data.input_image:
+            # Build multipart form data
+            form_data = {
+                "model": input_data.model or "sora-2",
+                "prompt": input_data.prompt,
+                "size": size,
+                "seconds": str(duration),
+            }
+
+            # Prepare the image file
+            image = input_data.input_image
+            if (
+                image.path or image.raw_bytes is not None or image.base64
+            ) and image.mime_type:
+                # Use in-memory bytes directly, reading the file off the event
+                # loop or decoding base64 only if needed
+                if image.path:
+                    image_bytes = await asyncio.to_thread(Path(image.path).read_bytes)
+                elif image.raw_bytes is not None:
+                    image_bytes = image.raw_bytes
+                else:
+                    image_bytes = pybase64.b64decode(image.base64)
+                # Determine file extension from mime type
+                ext = image.mime_type.split("/")[-1]
+                if ext == "jpeg":
+                    ext = "jpg"
+                filename = f"input_image.{ext}"
+
+                files = {
+                    "input_reference": (filename, image_bytes, image.mime_type),
                 }
 
-                # Prepare the image file
-                image = input_data.input_image
-                if image.base64 and image.mime_type:
-                    # Decode base64 to bytes
-                    image_bytes = base64.b64decode(image.base64)
-                    # Determine file extension from mime type
-                    ext = image.mime_type.split("/")[-1]
-                    if ext == "jpeg":
-                        ext = "jpg"
-                    filename = f"input_image.{ext}"
-
-                    files = {
-                        "input_reference": (filename, image_bytes, image.mime_type),
-                    }
-
-                    response = await client.post(
-                        f"{self.BASE_URL}/videos",
-                        headers={"Authorization": f"Bearer {self.api_key}"},
-                        data=form_data,
-                        files=files,
-                        timeout=60.0,
-                    )
-                elif image.url:
-                    # For URL, we need to download and re-upload
-                    # Or use JSON format if API supports it
-                    # For now, download the image first (follow redirects)
-                    img_response = await client.get(
+                response = await client.post(
+                    "/videos",
+                    data=form_data,
+                    files=files,
+                    timeout=60.0,
+                )
+            elif image.url:
+                # For URL, we need to download and re-upload
+                # Or use JSON format if API supports it
+                # For now, download the image first (follow redirects).
+                # Use a separate client so the API key isn't sent to a third party.
+                async with httpx.AsyncClient() as image_client:
+                    img_response = await image_client.get(
                         image.url, timeout=30.0, follow_redirects=True
                     )
-                    img_response.raise_for_status()
-                    image_bytes = img_response.content
-
-                    # Guess content type
-                    content_type = img_response.headers.get("content-type", "image/jpeg")
-                    ext = content_type.split("/")[-1]
-                    if ext == "jpeg":
-                        ext = "jpg"
-                    filename = f"input_image.{ext}"
-
-                    files = {
-                        "input_reference": (filename, image_bytes, content_type),
-                    }
-
-                    response = await client.post(
-                        f"{self.BASE_URL}/videos",
-                        headers={"Authorization": f"Bearer {self.api_key}"},
-                        data=form_data,
-                        files=files,
-                        timeout=60.0,
-                    )
-                else:
-                    raise InvalidConfigurationError(
-                        "sora", "Image must have url or base64+mime_type"
-                    )
-            else:
-                # No image - use JSON payload
-                payload: dict[str, Any] = {
-                    "model": input_data.model or "sora-2",
-                    "prompt": input_data.prompt,
-                    "size": size,
-                    "seconds": str(duration),
+                img_response.raise_for_status()
+                image_bytes = img_response.content
+
+                # Guess content type
+                content_type = img_response.headers.get("content-type", "image/jpeg")
+                ext = content_type.split("/")[-1]
+                if ext == "jpeg":
+                    ext = "jpg"
+                filename = f"input_image.{ext}"
+
+                files = {
+                    "input_reference": (filename, image_bytes, content_type),
                 }
 
                 response = await client.post(
-                    f"{self.BASE_URL}/videos",
-                    headers=self._get_headers(),
-                    json=payload,
-                    timeout=30.0,
+                    "/videos",
+                    data=form_data,
+                    files=files,
+                    timeout=60.0,
                 )
-
-            if response.status_code == 401:
-                raise ProviderAuthenticationError("sora", "Invalid API key")
-
-            if response.status_code != 200 and response.status_code != 201:
-                error_detail = None
-                try:
-                    error_data = response.json()
-                    error_detail = error_data.get("error", {}).get("message")
-                except Exception:
-                    error_detail = response.text
-                raise VideoGenerationRequestError(
-                    "sora", response.status_code, error_detail
+            else:
+                raise InvalidConfigurationError(
+                    "sora", "Image must have url, path+mime_type or base64+mime_type"
                 )
+        else:
+            # No image - use JSON payload
+            payload: dict[str, Any] = {
+                "model": input_data.model or "sora-2",
+                "prompt": input_data.prompt,
+                "size": size,
+                "seconds": str(duration),
+            }
 
-            data = response.json()
-            return self._parse_video_response(data)
+            response = await client.post(
+                "/videos",
+                json=payload,
+                timeout=30.0,
+            )
+
+        if response.status_code == 401:
+            raise ProviderAuthenticationError("sora", "Invalid API key")
+
+        if response.status_code != 200 and response.status_code != 201:
+            error_detail = None
+            try:
+                error_data = _json(response)
+                error_detail = error_data.get("error", {}).get("message")
+            except Exception:
+                error_detail = response.text
+            raise VideoGenerationRequestError(
+                "sora", response.status_code, error_detail
+            )
+
+        data = _json(response)
+        return self._parse_video_response(data)
 
     async def get_status(self, video_id: str) -> GeneratedVideo:
         """Get status of a Sora video generation."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/videos/{video_id}",
-                headers=self._get_headers(),
-                timeout=30.0,
+        return await self._single_flight(video_id, self._fetch_status)
+
+    async def _fetch_status(self, video_id: str) -> GeneratedVideo:
+        client = self._get_client()
+        for attempt in range(self.STATUS_RETRIES + 1):
+            response = await client.get(f"/videos/{video_id}")
+            if (
+                response.status_code not in self.RETRY_STATUS_CODES
+                or attempt == self.STATUS_RETRIES
+            ):
+                break
+            delay = self.RETRY_DELAY * 2**attempt
+            await asyncio.sleep(delay * random.uniform(0.9, 1.1))
+
+        if response.status_code == 404:
+            raise VideoNotFoundError("sora", video_id)
+
+        if response.status_code == 401:
+            raise ProviderAuthenticationError("sora", "Invalid API key")
+
+        if response.status_code != 200:
+            error_detail = None
+            try:
+                error_data = _json(response)
+                error_detail = error_data.get("error", {}).get("message")
+            except Exception:
+                error_detail = response.text
+            raise VideoGenerationRequestError(
+                "sora", response.status_code, error_detail
             )
 
-            if response.status_code == 404:
-                raise VideoNotFoundError("sora", video_id)
-
-            if response.status_code == 401:
-                raise ProviderAuthenticationError("sora", "Invalid API key")
-
-            if response.status_code != 200:
-                error_detail = None
-                try:
-                    error_data = response.json()
-                    error_detail = error_data.get("error", {}).get("message")
-                except Exception:
-                    error_detail = response.text
-                raise VideoGenerationRequestError(
-                    "sora", response.status_code, error_detail
-                )
-
-            data = response.json()
-            return self._parse_video_response(data)
+        data = _json(response)
+        return self._parse_video_response(data)
 
     async def get_video_url(self, video_id: str) -> str:
         """Get download URL for a completed Sora video."""
@@ -1,9 +1,16 @@
 """Veo (Google) video generation provider implementation."""
 
+import asyncio
+import functools
+import logging
 import os
-from datetime import datetime, timezone
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, TypeVar
 
+import httpx
+import pybase64
 from google import genai
 from google.genai import types
 
@@ -14,7 +21,24 @@ from ..exceptions import (
     VideoNotFoundError,
 )
 from ..types import GeneratedVideo, GenerationConfig, ImageInput, VeoInput
-from .base import VideoProvider
+from .base import VideoProvider, is_auth_error, iso_now, nearest_duration_map
+
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+
+def _redis_from_env() -> Any | None:
+    """Build a redis.asyncio client from REDIS_URL, if configured and installed."""
+    url = os.environ.get("REDIS_URL")
+    if not url:
+        return None
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        logger.warning("REDIS_URL is set but the redis package is not installed")
+        return None
+    return aioredis.from_url(url)
 
 
 class VeoProvider(VideoProvider):
@@ -23,20 +47,41 @@ class VeoProvider(VideoProvider):
     provider_name = "veo"
 
     # Veo supports these durations
-    SUPPORTED_DURATIONS = [4, 6, 8]
+    SUPPORTED_DURATIONS = (4, 6, 8)
+    _DURATION_MAP = nearest_duration_map(SUPPORTED_DURATIONS)
 
     # Hardcoded defaults per spec
     GENERATE_AUDIO = True
     PERSON_GENERATION = "allow_all"
 
-    def __init__(self, api_key: str | None = None, project: str | None = None):
+    # The genai SDK is blocking; its calls run on this many worker threads
+    EXECUTOR_WORKERS = 16
+
+    # Cap on remembered operation timestamps (oldest evicted first)
+    MAX_TRACKED_OPERATIONS = 10_000
+
+    # Shared-cache TTLs (seconds): operation start times outlive the longest
+    # job, completed results are immutable so can be kept for a day
+    OPERATION_TTL = 7200
+    COMPLETED_TTL = 86400
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        project: str | None = None,
+        redis_client: Any | None = None,
+    ):
         """
         Initialize Veo provider.
 
         Args:
             api_key: Google API key. If not provided, uses GOOGLE_API_KEY env var.
             project: Google Cloud project ID for Vertex AI mode (preferred for Veo).
+            redis_client: Optional redis.asyncio client shared between workers for
+                operation start times and completed results. Built from REDIS_URL
+                when not provided.
         """
+        super().__init__()
         self.api_key = api_key or os.environ.get("GOOGLE_API_KEY")
         self.project = project or os.environ.get("GOOGLE_CLOUD_PROJECT")
 
@@ -46,63 +91,180 @@ class VeoProvider(VideoProvider):
                 "GOOGLE_API_KEY or GOOGLE_CLOUD_PROJECT environment variable not set",
             )
 
+        # One pooled HTTP/2 session, kept alive across submit/poll calls
+        http_options = types.HttpOptions(
+            client_args={
+                "http2": True,
+                "limits": httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60,
+                ),
+            }
+        )
+
         # Initialize the client - prefer Vertex AI for Veo when project is set
         if self.project:
             # Vertex AI mode (uses default credentials / ADC)
-            self.client = genai.Client(vertexai=True, project=self.project, location="us-central1")
+            self.client = genai.Client(
+                vertexai=True,
+                project=self.project,
+                location="us-central1",
+                http_options=http_options,
+            )
             self.is_vertex_ai = True
         else:
             # API key mode (Gemini API)
-            self.client = genai.Client(api_key=self.api_key)
+            self.client = genai.Client(api_key=self.api_key, http_options=http_options)
             self.is_vertex_ai = False
 
-        # Store operation mapping (operation_name -> created_at)
-        self._operations: dict[str, str] = {}
+        # Config fields only accepted by Vertex AI, merged into every request
+        self._vertex_extra: dict[str, Any] = (
+            {
+                "generate_audio": self.GENERATE_AUDIO,
+                "person_generation": self.PERSON_GENERATION,
+            }
+            if self.is_vertex_ai
+            else {}
+        )
+
+        # Store operation mapping (operation_name -> created_at), LRU-bounded
+        self._operations: OrderedDict[str, str] = OrderedDict()
+
+        # (aspect_ratio, duration, num_outputs) -> validated config template
+        self._config_templates: dict[tuple[str, int, int], types.GenerateVideosConfig] = {}
+
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Built on first use so its connection pool binds to the running loop
+        self._redis = redis_client
+        self._use_redis = redis_client is not None or bool(
+            os.environ.get("REDIS_URL")
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the SDK worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.EXECUTOR_WORKERS, thread_name_prefix="veo"
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:
+        """Run a blocking SDK call on the provider's executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    def _get_redis(self) -> Any | None:
+        """Return the shared-cache client, creating it from REDIS_URL on first use."""
+        if self._redis is None and self._use_redis:
+            self._redis = _redis_from_env()
+            self._use_redis = self._redis is not None
+        return self._redis
+
+    async def aclose(self) -> None:
+        """Release the SDK worker threads and the shared-cache connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def _remember_operation(self, operation_name: str, created_at: str) -> None:
+        """Record an operation's creation time, evicting the oldest past the cap."""
+        self._operations[operation_name] = created_at
+        self._operations.move_to_end(operation_name)
+        if len(self._operations) > self.MAX_TRACKED_OPERATIONS:
+            self._operations.popitem(last=False)
+
+    async def _redis_get(self, key: str) -> str | None:
+        """Read a shared-cache key; cache failures are logged and treated as misses."""
+        try:
+            value = await self._redis.get(key)
+        except Exception:
+            logger.warning("Redis get failed for %s", key, exc_info=True)
+            return None
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def _redis_set(self, key: str, ttl: int, value: str) -> None:
+        try:
+            await self._redis.setex(key, ttl, value)
+        except Exception:
+            logger.warning("Redis set failed for %s", key, exc_info=True)
 
     def _validate_duration(self, duration: int) -> int:
         """Validate and return duration for Veo."""
-        if duration not in self.SUPPORTED_DURATIONS:
-            # Find closest supported duration
+        closest = self._DURATION_MAP.get(duration)
+        if closest is None:
+            # Outside the precomputed range - find closest supported duration
             closest = min(self.SUPPORTED_DURATIONS, key=lambda x: abs(x - duration))
-            return closest
-        return duration
+        return closest
 
     def _get_aspect_ratio(self, config: GenerationConfig) -> str:
         """Get aspect ratio string for Veo API."""
         return config.aspect_ratio
 
-    def _build_image(self, image: ImageInput) -> types.Image:
+    async def _build_image(self, image: ImageInput) -> types.Image:
         """Build Image object for Veo API.
 
         Note: Veo's types.Image only supports:
         - gcsUri: For Google Cloud Storage URIs (gs://...)
         - imageBytes + mimeType: For raw image bytes
 
-        HTTP URLs must be downloaded first or converted to base64.
+        HTTP URLs are downloaded and passed as bytes. File reads and base64
+        decoding run off the event loop.
         """
         if image.url:
             # Check if it's a GCS URI
             if image.url.startswith("gs://"):
                 return types.Image(gcsUri=image.url)
-            # For HTTP URLs, the caller should have converted to base64
-            # or we can try using from_file which handles more cases
             try:
-                return types.Image.from_file(location=image.url)
-            except Exception:
+                async with httpx.AsyncClient(timeout=60.0) as client:
+                    response = await client.get(image.url)
+                    response.raise_for_status()
+            except httpx.HTTPError as e:
                 raise InvalidConfigurationError(
-                    "veo",
-                    "HTTP URLs must be converted to base64 or use GCS URIs (gs://...)",
-                )
+                    "veo", f"Failed to download image from {image.url}: {e}"
+                ) from e
+            mime_type = (
+                image.mime_type
+                or response.headers.get("content-type", "").split(";")[0]
+                or "image/jpeg"
+            )
+            return types.Image(imageBytes=response.content, mimeType=mime_type)
+        elif image.raw_bytes is not None and image.mime_type:
+            return types.Image(imageBytes=image.raw_bytes, mimeType=image.mime_type)
+        elif image.path and image.mime_type:
+            return types.Image(
+                imageBytes=await asyncio.to_thread(Path(image.path).read_bytes),
+                mimeType=image.mime_type,
+            )
         elif image.base64 and image.mime_type:
             # Convert base64 string to bytes
-            import base64 as b64
-
-            image_bytes = b64.b64decode(image.base64)
+            image_bytes = await asyncio.to_thread(pybase64.b64decode, image.base64)
             return types.Image(
                 imageBytes=image_bytes,
                 mimeType=image.mime_type,
             )
-        raise InvalidConfigurationError("veo", "Image must have url (GCS) or base64+mime_type")
+        raise InvalidConfigurationError(
+            "veo",
+            "Image must have url, or raw_bytes, path or base64 with mime_type",
+        )
+
+    async def _build_images(
+        self, input_data: VeoInput
+    ) -> tuple[types.Image | None, list[types.Image]]:
+        """Build the input image and reference images concurrently."""
+        inputs = list(input_data.reference_images or [])
+        if input_data.input_image:
+            inputs.insert(0, input_data.input_image)
+        built = await asyncio.gather(*(self._build_image(img) for img in inputs))
+        if input_data.input_image:
+            return built[0], list(built[1:])
+        return None, list(built)
 
     def _parse_operation_to_video(
         self,
@@ -111,10 +273,7 @@ class VeoProvider(VideoProvider):
         error: str | None = None,
     ) -> GeneratedVideo:
         """Convert operation response to GeneratedVideo."""
-        created_at = self._operations.get(
-            operation_name,
-            datetime.now(tz=timezone.utc).isoformat(),
-        )
+        created_at = self._operations.get(operation_name) or iso_now()
 
         # Determine status based on operation state
         if error:
@@ -161,77 +320,113 @@ class VeoProvider(VideoProvider):
             has_audio=self.GENERATE_AUDIO,
         )
 
-    async def generate(
-        self,
-        input_data: VeoInput,
-        config: GenerationConfig,
-    ) -> GeneratedVideo:
-        """Start video generation with Veo."""
+    def _base_config(
+        self, aspect_ratio: str, duration: int, num_outputs: int
+    ) -> types.GenerateVideosConfig:
+        """Return the validated config template for these request parameters."""
+        key = (aspect_ratio, duration, num_outputs)
+        template = self._config_templates.get(key)
+        if template is None:
+            # generate_audio and person_generation only work in Vertex AI
+            template = types.GenerateVideosConfig(
+                aspect_ratio=aspect_ratio,
+                duration_seconds=duration,
+                number_of_videos=num_outputs,
+                **self._vertex_extra,
+            )
+            self._config_templates[key] = template
+        return template
+
+    def _request_error(self, e: Exception) -> Exception:
+        """Map an SDK exception to the provider's error types."""
+        error_msg = str(e)
+        if is_auth_error(e):
+            return ProviderAuthenticationError("veo", error_msg)
+        return VideoGenerationRequestError("veo", details=error_msg)
+
+    async def _submit(self, input_data: VeoInput, config: GenerationConfig) -> Any:
+        """Build the request and start a generate_videos operation."""
         duration = self._validate_duration(config.duration)
         aspect_ratio = self._get_aspect_ratio(config)
-
-        # Build generation config
         model_name = input_data.model or "veo-3.1-fast-generate-preview"
 
-        # Build config kwargs - generate_audio and person_generation only work in Vertex AI
-        config_kwargs = {
-            "aspect_ratio": aspect_ratio,
-            "duration_seconds": duration,
-            "negative_prompt": input_data.negative_prompt,
-            "number_of_videos": input_data.num_outputs or 1,
-        }
-        if self.is_vertex_ai:
-            config_kwargs["generate_audio"] = self.GENERATE_AUDIO
-            config_kwargs["person_generation"] = self.PERSON_GENERATION
-
-        # Build the request
-        generate_config = types.GenerateVideosConfig(**config_kwargs)
-
         # Build image inputs if provided
-        image = None
-        if input_data.input_image:
-            image = self._build_image(input_data.input_image)
-
-        # Build reference images if provided
-        if input_data.reference_images:
-            reference_images = [
-                self._build_image(img) for img in input_data.reference_images
-            ]
-            config_kwargs["reference_images"] = reference_images
-            generate_config = types.GenerateVideosConfig(**config_kwargs)
+        image, reference_images = await self._build_images(input_data)
+
+        # Per-request fields are patched onto a copy of the cached template,
+        # skipping re-validation of the shared fields
+        generate_config = self._base_config(
+            aspect_ratio, duration, input_data.num_outputs or 1
+        ).model_copy(
+            update={
+                "negative_prompt": input_data.negative_prompt,
+                "reference_images": reference_images or None,
+            }
+        )
 
         try:
-            # Start the generation operation
-            operation = self.client.models.generate_videos(
+            return await self._run(
+                self.client.models.generate_videos,
                 model=model_name,
                 prompt=input_data.prompt,
                 image=image,
                 config=generate_config,
             )
+        except Exception as e:
+            raise self._request_error(e) from e
 
-            # Store operation metadata
-            operation_name = getattr(operation, "name", str(id(operation)))
-            created_at = datetime.now(tz=timezone.utc).isoformat()
-            self._operations[operation_name] = created_at
-
-            return GeneratedVideo(
-                id=operation_name,
-                status="in_progress",
-                created_at=created_at,
-                has_audio=self.GENERATE_AUDIO,
+    async def generate(
+        self,
+        input_data: VeoInput,
+        config: GenerationConfig,
+    ) -> GeneratedVideo:
+        """Start video generation with Veo."""
+        operation = await self._submit(input_data, config)
+
+        # Store operation metadata
+        operation_name = getattr(operation, "name", str(id(operation)))
+        created_at = iso_now()
+        self._remember_operation(operation_name, created_at)
+        if self._get_redis() is not None:
+            await self._redis_set(
+                f"veo:op:{operation_name}", self.OPERATION_TTL, created_at
             )
 
-        except Exception as e:
-            error_msg = str(e)
-            if "401" in error_msg or "403" in error_msg or "authentication" in error_msg.lower():
-                raise ProviderAuthenticationError("veo", error_msg)
-            raise VideoGenerationRequestError("veo", details=error_msg)
+        return GeneratedVideo(
+            id=operation_name,
+            status="in_progress",
+            created_at=created_at,
+            has_audio=self.GENERATE_AUDIO,
+        )
 
     async def get_status(self, video_id: str) -> GeneratedVideo:
         """Get status of a Veo video generation (operation)."""
+        return await self._single_flight(video_id, self._fetch_status)
+
+    async def _fetch_status(self, video_id: str) -> GeneratedVideo:
+        if self._get_redis() is None:
+            return await self._poll_operation(video_id)
+
+        cached = await self._redis_get(f"veo:done:{video_id}")
+        if cached:
+            return GeneratedVideo.model_validate_json(cached)
+        if video_id not in self._operations:
+            # Submitted by another worker - pick up its start time
+            created_at = await self._redis_get(f"veo:op:{video_id}")
+            if created_at:
+                self._remember_operation(video_id, created_at)
+
+        video = await self._poll_operation(video_id)
+        if video.status == "completed":
+            await self._redis_set(
+                f"veo:done:{video_id}", self.COMPLETED_TTL, video.model_dump_json()
+            )
+        return video
+
+    async def _poll_operation(self, video_id: str) -> GeneratedVideo:
         try:
             # Get operation status
-            operation = self.client.operations.get(name=video_id)
+            operation = await self._run(self.client.operations.get, name=video_id)
 
             # Check if operation is done
             if hasattr(operation, "done") and operation.done:
@@ -253,7 +448,7 @@ class VeoProvider(VideoProvider):
             error_msg = str(e)
             if "404" in error_msg or "not found" in error_msg.lower():
                 raise VideoNotFoundError("veo", video_id)
-            if "401" in error_msg or "403" in error_msg:
+            if is_auth_error(e):
                 raise ProviderAuthenticationError("veo", error_msg)
             raise VideoGenerationRequestError("veo", details=error_msg)
 
@@ -283,48 +478,14 @@ class VeoProvider(VideoProvider):
         This is a convenience method that returns all generated videos from
         a single operation.
         """
-        duration = self._validate_duration(config.duration)
-        aspect_ratio = self._get_aspect_ratio(config)
-        model_name = input_data.model or "veo-3.1-fast-generate-preview"
-        num_outputs = input_data.num_outputs or 1
-
-        # Build config kwargs - generate_audio and person_generation only work in Vertex AI
-        config_kwargs = {
-            "aspect_ratio": aspect_ratio,
-            "duration_seconds": duration,
-            "negative_prompt": input_data.negative_prompt,
-            "number_of_videos": num_outputs,
-        }
-        if self.is_vertex_ai:
-            config_kwargs["generate_audio"] = self.GENERATE_AUDIO
-            config_kwargs["person_generation"] = self.PERSON_GENERATION
-
-        generate_config = types.GenerateVideosConfig(**config_kwargs)
-
-        image = None
-        if input_data.input_image:
-            image = self._build_image(input_data.input_image)
-
-        if input_data.reference_images:
-            reference_images = [
-                self._build_image(img) for img in input_data.reference_images
-            ]
-            config_kwargs["reference_images"] = reference_images
-            generate_config = types.GenerateVideosConfig(**config_kwargs)
+        operation = await self._submit(input_data, config)
 
         try:
-            operation = self.client.models.generate_videos(
-                model=model_name,
-                prompt=input_data.prompt,
-                image=image,
-                config=generate_config,
-            )
-
             # Wait for the result
-            result = operation.result()
+            result = await self._run(operation.result)
 
             # Parse all generated videos
-            created_at = datetime.now(tz=timezone.utc).isoformat()
+            created_at = iso_now()
             videos = []
 
             if hasattr(result, "generated_videos"):
@@ -346,7 +507,4 @@ class VeoProvider(VideoProvider):
             return videos
 
         except Exception as e:
-            error_msg = str(e)
-            if "401" in error_msg or "403" in error_msg:
-                raise ProviderAuthenticationError("veo", error_msg)
-            raise VideoGenerationRequestError("veo", details=error_msg)
+            raise self._request_error(e) from e
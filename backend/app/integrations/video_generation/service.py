@@ -1,10 +1,20 @@
 """Unified video generation service that routes to appropriate providers."""
 
 import asyncio
-from typing import Literal
+import functools
+import random
+from collections import OrderedDict
+from typing import Literal, overload
 
-from .exceptions import ProviderNotFoundError
+import httpx
+
+from .exceptions import (
+    ProviderNotFoundError,
+    VideoGenerationRequestError,
+    VideoGenerationTimeoutError,
+)
 from .providers import SoraProvider, VeoProvider, VideoProvider
+from .providers.base import iso_now
 from .types import (
     GeneratedVideo,
     GenerationConfig,
@@ -15,6 +25,45 @@ from .types import (
 )
 
 
+@functools.lru_cache(maxsize=8)
+def _build_provider(
+    provider_name: str,
+    sora_api_key: str | None,
+    google_api_key: str | None,
+    google_project: str | None,
+) -> VideoProvider:
+    """Create a provider, shared process-wide per credential set.
+
+    Provider construction sets up SDK clients, credentials and connection
+    pools, so every service instance reuses the same provider objects.
+    """
+    if provider_name == "sora":
+        return SoraProvider(api_key=sora_api_key)
+    if provider_name == "veo":
+        return VeoProvider(api_key=google_api_key, project=google_project)
+    raise ProviderNotFoundError(provider_name)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a status lookup error is worth retrying on the next round."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, VideoGenerationRequestError):
+        status = error.status_code
+        return status is not None and (status == 429 or status >= 500)
+    return False
+
+
+def _failed_video(video_id: str, error: BaseException) -> GeneratedVideo:
+    """Stand-in result for a batch entry whose provider call raised."""
+    return GeneratedVideo(
+        id=video_id,
+        status="failed",
+        created_at=iso_now(),
+        error=str(error) or type(error).__name__,
+    )
+
+
 class VideoGenerationService:
     """
     Unified service for video generation across multiple providers.
@@ -23,11 +72,15 @@ class VideoGenerationService:
     the input's provider field.
     """
 
+    # Completed/failed statuses are final; this many are kept per service
+    MAX_TERMINAL_CACHE = 4096
+
     def __init__(
         self,
         sora_api_key: str | None = None,
         google_api_key: str | None = None,
         google_project: str | None = None,
+        max_concurrency: int = 16,
     ):
         """
         Initialize the video generation service.
@@ -36,25 +89,51 @@ class VideoGenerationService:
             sora_api_key: OpenAI API key for Sora. Uses OPENAI_API_KEY env var if not provided.
             google_api_key: Google API key for Veo. Uses GOOGLE_API_KEY env var if not provided.
             google_project: Google Cloud project for Vertex AI mode.
+            max_concurrency: Maximum provider submissions in flight per batch.
         """
         self._providers: dict[str, VideoProvider] = {}
         self._sora_api_key = sora_api_key
         self._google_api_key = google_api_key
         self._google_project = google_project
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # (provider, video_id) -> completed/failed status (LRU)
+        self._terminal: OrderedDict[tuple[str, str], GeneratedVideo] = OrderedDict()
 
     def _get_provider(self, provider_name: Literal["sora", "veo"]) -> VideoProvider:
         """Get or create a provider instance."""
-        if provider_name not in self._providers:
-            if provider_name == "sora":
-                self._providers["sora"] = SoraProvider(api_key=self._sora_api_key)
-            elif provider_name == "veo":
-                self._providers["veo"] = VeoProvider(
-                    api_key=self._google_api_key,
-                    project=self._google_project,
-                )
-            else:
-                raise ProviderNotFoundError(provider_name)
-        return self._providers[provider_name]
+        provider = self._providers.get(provider_name)
+        if provider is None:
+            provider = _build_provider(
+                provider_name,
+                self._sora_api_key,
+                self._google_api_key,
+                self._google_project,
+            )
+            self._providers[provider_name] = provider
+        return provider
+
+    def _cached_terminal(self, provider: str, video_id: str) -> GeneratedVideo | None:
+        video = self._terminal.get((provider, video_id))
+        if video is not None:
+            self._terminal.move_to_end((provider, video_id))
+        return video
+
+    def _remember_terminal(self, provider: str, video: GeneratedVideo) -> None:
+        if video.status not in ("completed", "failed"):
+            return
+        self._terminal[(provider, video.id)] = video
+        self._terminal.move_to_end((provider, video.id))
+        if len(self._terminal) > self.MAX_TERMINAL_CACHE:
+            self._terminal.popitem(last=False)
+
+    async def aclose(self) -> None:
+        """Close the pooled resources of the providers this service used.
+
+        Providers are shared, so they recreate their pools if used again.
+        """
+        for provider in self._providers.values():
+            await provider.aclose()
+        self._providers.clear()
 
     async def generate(
         self,
@@ -92,6 +171,9 @@ class VideoGenerationService:
         """
         Generate multiple videos in parallel.
 
+        At most max_concurrency submissions are in flight at once. A failing
+        input doesn't abort the batch; it comes back as a failed video.
+
         Args:
             inputs: List of (input_data, input_index) tuples
             config: Generation configuration applied to all inputs
@@ -111,7 +193,8 @@ class VideoGenerationService:
         async def generate_one(
             input_data: VideoGenerationInput, input_index: int
         ) -> GenerationResult:
-            video = await self.generate(input_data, config)
+            async with self._semaphore:
+                video = await self.generate(input_data, config)
             return GenerationResult(
                 input_index=input_index,
                 provider=input_data.provider,
@@ -119,7 +202,17 @@ class VideoGenerationService:
             )
 
         tasks = [generate_one(input_data, idx) for input_data, idx in inputs]
-        return await asyncio.gather(*tasks)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            result
+            if not isinstance(result, BaseException)
+            else GenerationResult(
+                input_index=idx,
+                provider=input_data.provider,
+                video=_failed_video("", result),
+            )
+            for result, (input_data, idx) in zip(results, inputs)
+        ]
 
     async def get_status(
         self,
@@ -136,15 +229,21 @@ class VideoGenerationService:
         Returns:
             GeneratedVideo with current status and progress
         """
+        cached = self._cached_terminal(provider, video_id)
+        if cached is not None:
+            return cached
         provider_instance = self._get_provider(provider)
-        return await provider_instance.get_status(video_id)
+        video = await provider_instance.get_status(video_id)
+        self._remember_terminal(provider, video)
+        return video
 
     async def wait_for_completion(
         self,
         provider: Literal["sora", "veo"],
         video_id: str,
-        poll_interval: float = 5.0,
+        poll_interval: float = 1.0,
         timeout: float = 600.0,
+        max_interval: float = 30.0,
     ) -> GeneratedVideo:
         """
         Wait for a video generation to complete.
@@ -152,49 +251,160 @@ class VideoGenerationService:
         Args:
             provider: The provider that created the video ("sora" or "veo")
             video_id: The provider's unique video identifier
-            poll_interval: Seconds between status checks
+            poll_interval: Initial seconds between status checks; backs off
+                exponentially (with jitter) from here
             timeout: Maximum seconds to wait
+            max_interval: Upper bound on the backed-off poll interval
 
         Returns:
             GeneratedVideo with final status (completed or failed)
         """
+        cached = self._cached_terminal(provider, video_id)
+        if cached is not None:
+            return cached
         provider_instance = self._get_provider(provider)
         return await provider_instance.wait_for_completion(
-            video_id, poll_interval, timeout
+            video_id, poll_interval, timeout, max_interval
         )
 
+    @overload
+    async def get_status_batch(
+        self,
+        videos: list[tuple[Literal["sora", "veo"], str]],
+        return_exceptions: Literal[False] = False,
+    ) -> list[GeneratedVideo]: ...
+
+    @overload
+    async def get_status_batch(
+        self,
+        videos: list[tuple[Literal["sora", "veo"], str]],
+        return_exceptions: Literal[True],
+    ) -> list[GeneratedVideo | BaseException]: ...
+
+    async def get_status_batch(
+        self,
+        videos: list[tuple[Literal["sora", "veo"], str]],
+        return_exceptions: bool = False,
+    ) -> list[GeneratedVideo] | list[GeneratedVideo | BaseException]:
+        """
+        Get the current status of many videos in one pass.
+
+        IDs are grouped per provider and each group is fetched with a single
+        get_status_many call; groups run concurrently. Videos already known
+        to be completed or failed are answered from memory. A lookup that
+        raises comes back as a failed video, or, with return_exceptions, as
+        the exception itself so callers can tell it from a real failure.
+
+        Args:
+            videos: List of (provider, video_id) tuples
+            return_exceptions: Return lookup errors in place instead of
+                failed videos
+
+        Returns:
+            Statuses in the same order as the input
+        """
+        by_position: dict[int, GeneratedVideo | BaseException] = {}
+        groups: dict[Literal["sora", "veo"], list[int]] = {}
+        for pos, (provider, video_id) in enumerate(videos):
+            cached = self._cached_terminal(provider, video_id)
+            if cached is not None:
+                by_position[pos] = cached
+            else:
+                groups.setdefault(provider, []).append(pos)
+
+        async def fetch_group(
+            provider: Literal["sora", "veo"], positions: list[int]
+        ) -> list[GeneratedVideo | BaseException]:
+            provider_instance = self._get_provider(provider)
+            return await provider_instance.get_status_many([videos[p][1] for p in positions])
+
+        fetched = await asyncio.gather(
+            *(fetch_group(provider, positions) for provider, positions in groups.items())
+        )
+
+        for (provider, positions), results in zip(groups.items(), fetched):
+            for pos, result in zip(positions, results):
+                if isinstance(result, BaseException):
+                    # Not cached: the lookup failing doesn't make the video final
+                    by_position[pos] = (
+                        result
+                        if return_exceptions
+                        else _failed_video(videos[pos][1], result)
+                    )
+                else:
+                    self._remember_terminal(provider, result)
+                    by_position[pos] = result
+        return [by_position[pos] for pos in range(len(videos))]
+
     async def wait_for_batch(
         self,
         videos: list[tuple[Literal["sora", "veo"], str, int]],
-        poll_interval: float = 5.0,
+        poll_interval: float = 1.0,
         timeout: float = 600.0,
+        max_interval: float = 30.0,
     ) -> list[GenerationResult]:
         """
         Wait for multiple video generations to complete in parallel.
 
+        All pending videos are polled together each round via
+        get_status_batch, so the request rate per interval is one pass over
+        the pending set rather than one loop per video. A status lookup that
+        hits a transient error (network, 429, 5xx) leaves the video pending
+        for the next round; any other lookup error fails it right away. A video still pending at the timeout comes
+        back as failed instead of aborting the others.
+
         Args:
             videos: List of (provider, video_id, input_index) tuples
-            poll_interval: Seconds between status checks
+            poll_interval: Initial seconds between status checks
             timeout: Maximum seconds to wait
+            max_interval: Upper bound on the backed-off poll interval
 
         Returns:
             List of GenerationResult objects with final statuses
         """
-
-        async def wait_one(
-            provider: Literal["sora", "veo"], video_id: str, input_index: int
-        ) -> GenerationResult:
-            video = await self.wait_for_completion(
-                provider, video_id, poll_interval, timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval = poll_interval
+        final: dict[int, GeneratedVideo] = {}
+        pending = list(range(len(videos)))
+
+        while pending:
+            statuses = await self.get_status_batch(
+                [(videos[pos][0], videos[pos][1]) for pos in pending],
+                return_exceptions=True,
             )
-            return GenerationResult(
-                input_index=input_index,
-                provider=provider,
-                video=video,
-            )
-
-        tasks = [wait_one(provider, video_id, idx) for provider, video_id, idx in videos]
-        return await asyncio.gather(*tasks)
+            still_pending = []
+            for pos, video in zip(pending, statuses):
+                if isinstance(video, BaseException):
+                    if _is_transient(video):
+                        # The video may still be rendering; ask again next round
+                        still_pending.append(pos)
+                    else:
+                        # e.g. unknown id or bad credentials: waiting won't help
+                        final[pos] = _failed_video(videos[pos][1], video)
+                elif video.status in ("completed", "failed"):
+                    final[pos] = video
+                else:
+                    still_pending.append(pos)
+            pending = still_pending
+            if not pending:
+                break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                for pos in pending:
+                    provider, video_id, _ = videos[pos]
+                    final[pos] = _failed_video(
+                        video_id, VideoGenerationTimeoutError(provider, video_id, timeout)
+                    )
+                break
+            await asyncio.sleep(min(interval * random.uniform(0.9, 1.1), remaining))
+            interval = min(interval * VideoProvider.POLL_BACKOFF, max_interval)
+
+        return [
+            GenerationResult(input_index=idx, provider=provider, video=final[pos])
+            for pos, (provider, _, idx) in enumerate(videos)
+        ]
 
     async def get_video_url(
         self,
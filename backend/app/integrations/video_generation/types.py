@@ -3,16 +3,25 @@
 from datetime import datetime
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ImageInput(BaseModel):
     """Image input for video generation (first frame, last frame, or reference)."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     url: Optional[str] = Field(None, description="URL to image file")
     base64: Optional[str] = Field(None, description="Base64-encoded image data")
+    path: Optional[str] = Field(None, description="Local file path to image data")
+    raw_bytes: Optional[bytes] = Field(
+        None,
+        description="Raw image bytes already in memory (not serialized)",
+        exclude=True,
+        repr=False,
+    )
     mime_type: Optional[Literal["image/jpeg", "image/png", "image/webp"]] = Field(
-        None, description="Image MIME type (required when using base64)"
+        None, description="Image MIME type (required when using base64, path or raw_bytes)"
     )
 
 
@@ -60,6 +69,8 @@ VideoGenerationInput = SoraInput | VeoInput
 class GenerationConfig(BaseModel):
     """Configuration for video generation (applies to all providers)."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     duration: int = Field(
         8,
         description="Video duration in seconds (4, 6, 8, 12). 6s: Veo only, 12s: Sora only",
@@ -71,6 +82,8 @@ class GenerationConfig(BaseModel):
 class GeneratedVideo(BaseModel):
     """Output from video generation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(..., description="Provider's unique video identifier")
     status: Literal["queued", "in_progress", "completed", "failed"] = Field(
         ..., description="Generation status"
@@ -91,6 +104,8 @@ class GeneratedVideo(BaseModel):
 class GenerationResult(BaseModel):
     """Result of a video generation request, including the input used."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     input_index: int = Field(
         ..., ge=0, description="Index of the generation_input this result corresponds to"
     )
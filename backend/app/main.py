@@ -6,11 +6,15 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import asyncio
+import logging
+import os
 import subprocess
 import tempfile
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import AsyncIterator, Literal
 
 from pydantic import BaseModel
 
@@ -18,22 +22,59 @@ from chatkit.server import StreamingResult
 from chatkit.store import NotFoundError
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, Response, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from starlette.responses import JSONResponse
 
-from .server import VideoAssistantServer, create_chatkit_server
+from .generation_stream import GenerationStatusHub
+from .integrations.video_generation import GeneratedVideo, VideoGenerationService
+from .server import VideoAssistantServer, create_chatkit_server_async
 from .tools.video_generations import (
     VideoGenerations,
+    aclose_downloads,
     generate_videos_from_project,
     get_video_local_path,
     poll_and_save_video_generations,
 )
 from .video_project_state import VideoProjectState
 
+# Logging is configured here, at the app entrypoint, rather than in library
+# modules. Per-action INFO logs are noisy on hot paths; set LOG_LEVEL=INFO
+# (in the environment or .env) to see them
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+
 # Project root for storing generated videos
 _PROJECT_ROOT = Path(__file__).parent.parent
+_DATA_DIR = _PROJECT_ROOT / "data"
+
+# nginx internal location mapped to _DATA_DIR; unset means serve directly
+_ACCEL_REDIRECT_PREFIX = os.environ.get("VIDEO_ACCEL_REDIRECT_PREFIX", "").rstrip("/")
+
+# Shared across requests so provider HTTP connections are pooled
+_video_service = VideoGenerationService()
+
+# Submitted projects and their SSE status subscribers
+_status_hub = GenerationStatusHub(_PROJECT_ROOT, _video_service)
 
-app = FastAPI(title="OvenAI Video Generation API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the ChatKit server on startup and close pooled clients on shutdown."""
+    app.state.chatkit = await create_chatkit_server_async()
+    try:
+        yield
+    finally:
+        if app.state.chatkit is not None:
+            await app.state.chatkit.aclose()
+        await _status_hub.aclose()
+        await aclose_downloads()
+        await _video_service.aclose()
+
+
+app = FastAPI(
+    title="OvenAI Video Generation API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -41,12 +82,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-_chatkit_server: VideoAssistantServer | None = create_chatkit_server()
+async def get_chatkit_server(request: Request) -> VideoAssistantServer:
+    """Dependency to get the ChatKit server instance.
 
-
-def get_chatkit_server() -> VideoAssistantServer:
-    """Dependency to get the ChatKit server instance."""
-    if _chatkit_server is None:
+    Async so FastAPI calls it inline rather than in the threadpool.
+    """
+    server: VideoAssistantServer | None = getattr(request.app.state, "chatkit", None)
+    if server is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=(
@@ -54,7 +96,7 @@ def get_chatkit_server() -> VideoAssistantServer:
                 "package to enable the conversational endpoint."
             ),
         )
-    return _chatkit_server
+    return server
 
 
 @app.post("/chatkit")
@@ -75,16 +117,21 @@ async def chatkit_endpoint(
 async def read_project_state(
     thread_id: str,
     server: VideoAssistantServer = Depends(get_chatkit_server),
-) -> dict[str, Any]:
-    """Get video project state for a thread."""
-    state = await server.project_store.load(thread_id)
-    return {"project": state.to_payload(thread_id)}
+) -> Response:
+    """Get video project state for a thread.
+
+    The store caches the serialized body per state version, so repeated
+    reads return the same bytes without rebuilding or re-encoding them.
+    """
+    return Response(
+        server.project_store.payload_json(thread_id), media_type="application/json"
+    )
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> ORJSONResponse:
     """Health check endpoint."""
-    return {"status": "ok"}
+    return ORJSONResponse({"status": "ok"})
 
 
 @app.put("/attachments/{attachment_id}/upload")
@@ -93,15 +140,19 @@ async def upload_attachment(
     request: Request,
     server: VideoAssistantServer = Depends(get_chatkit_server),
 ) -> dict[str, str]:
-    """Upload attachment bytes for two-phase upload."""
-    data = await request.body()
-    if not data:
-        raise HTTPException(status_code=400, detail="Empty upload body")
+    """Upload attachment bytes for two-phase upload.
+
+    The body is streamed straight to disk rather than buffered in memory.
+    """
     attachment_store = server._get_attachment_store()
     try:
-        await attachment_store.save_upload(attachment_id, data, {"request": request})
+        await attachment_store.save_stream(
+            attachment_id, request.stream(), {"request": request}
+        )
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     return {"status": "ok"}
 
 
@@ -125,8 +176,17 @@ async def read_attachment(
     return FileResponse(path, media_type=attachment.mime_type, filename=attachment.name)
 
 
-@app.post("/generate")
-async def submit_generation(state: VideoProjectState) -> VideoGenerations:
+def _json_response(model: BaseModel) -> Response:
+    """Serialize an already-validated model straight to a response.
+
+    Skips FastAPI's response_model re-validation and jsonable_encoder pass;
+    the ``responses`` metadata on each route keeps the OpenAPI schema.
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+@app.post("/generate", responses={200: {"model": VideoGenerations}})
+async def submit_generation(state: VideoProjectState) -> Response:
     """Submit a video generation request.
 
     Receives a VideoProjectState with a storyboard containing segments,
@@ -135,18 +195,68 @@ async def submit_generation(state: VideoProjectState) -> VideoGenerations:
     Returns VideoGenerations with video IDs and initial status.
     """
     project_id = str(uuid.uuid4())
-    return await generate_videos_from_project(project_id, state)
+    generations = await generate_videos_from_project(
+        project_id, state, service=_video_service
+    )
+    _status_hub.update(generations)
+    return _json_response(generations)
 
 
-@app.post("/generate/status")
-async def poll_generation_status(generations: VideoGenerations) -> VideoGenerations:
+@app.post("/generate/status", responses={200: {"model": VideoGenerations}})
+async def poll_generation_status(generations: VideoGenerations) -> Response:
     """Poll for updated status of video generations.
 
     Receives a VideoGenerations object containing video IDs and providers,
     and returns an updated VideoGenerations with latest status/progress/URLs.
     Downloads completed videos to local storage.
     """
-    return await poll_and_save_video_generations(generations, _PROJECT_ROOT)
+    updated = await poll_and_save_video_generations(
+        generations, _PROJECT_ROOT, service=_video_service
+    )
+    _status_hub.update(updated)
+    return _json_response(updated)
+
+
+@app.get("/generate/stream/{project_id}")
+async def stream_generation_status(project_id: str) -> StreamingResponse:
+    """Stream status updates for a submitted project as server-sent events.
+
+    Sends every video once, then each video whose status, progress, URL or
+    error changes. Polling is shared by all clients watching the project and
+    the stream closes once no video is still in progress.
+    """
+    if project_id not in _status_hub:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project not found: {project_id}",
+        )
+
+    async def event_gen() -> AsyncIterator[str]:
+        async for video in _status_hub.subscribe(project_id):
+            yield f"data: {video.model_dump_json()}\n\n"
+
+    return StreamingResponse(event_gen(), media_type="text/event-stream")
+
+
+class VideoStatusQuery(BaseModel):
+    """A single video to look up in a batch status request."""
+
+    provider: Literal["sora", "veo"]
+    video_id: str
+
+
+@app.post("/generate/status/batch")
+async def poll_generation_status_batch(
+    videos: list[VideoStatusQuery],
+) -> list[GeneratedVideo]:
+    """Get the latest status of many videos in one request.
+
+    IDs are grouped per provider and fetched in a single pass; the response
+    is in the same order as the request. Nothing is downloaded.
+    """
+    return await _video_service.get_status_batch(
+        [(video.provider, video.video_id) for video in videos]
+    )
 
 
 @app.get("/videos/{project_id}/{segment_index}/{input_index}/{video_id}")
@@ -155,19 +265,34 @@ async def serve_video(
     segment_index: int,
     input_index: int,
     video_id: str,
-) -> FileResponse:
-    """Serve a generated video file."""
+) -> Response:
+    """Serve a generated video file.
+
+    Behind nginx, set VIDEO_ACCEL_REDIRECT_PREFIX to an internal location
+    aliased to the data directory and the file is handed off via
+    X-Accel-Redirect instead of being streamed through Python.
+    """
     file_path = get_video_local_path(
         _PROJECT_ROOT, project_id, segment_index, input_index, video_id
     )
 
-    if not file_path.exists():
+    try:
+        stat_result = await asyncio.to_thread(os.stat, file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Video not found: {video_id}",
         )
 
-    return FileResponse(file_path, media_type="video/mp4")
+    if _ACCEL_REDIRECT_PREFIX:
+        relative = file_path.relative_to(_DATA_DIR).as_posix()
+        return Response(
+            headers={"X-Accel-Redirect": f"{_ACCEL_REDIRECT_PREFIX}/{relative}"},
+            media_type="video/mp4",
+        )
+
+    # Reuse our stat so FileResponse doesn't stat the file again
+    return FileResponse(file_path, media_type="video/mp4", stat_result=stat_result)
 
 
 class VideoSegmentInfo(BaseModel):
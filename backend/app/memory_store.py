@@ -5,100 +5,200 @@ A production app would implement this using a persistent database.
 
 from __future__ import annotations
 
+import asyncio
+import binascii
+import itertools
+import os
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
-import json
+from datetime import datetime
 from pathlib import Path
+from typing import Generic, TypeVar
 
+import orjson
+import pybase64
 from chatkit.store import NotFoundError, Store
 from chatkit.types import Attachment, Page, ThreadItem, ThreadMetadata
 from pydantic import TypeAdapter
 
 
+_Row = TypeVar("_Row", ThreadMetadata, ThreadItem)
+
+_ATTACHMENT_ADAPTER: TypeAdapter[Attachment] = TypeAdapter(Attachment)
+
+
+_Key = tuple[datetime, int, str]
+
+
+def _encode_cursor(key: _Key) -> str:
+    created_at, seq, row_id = key
+    return pybase64.urlsafe_b64encode(
+        f"{created_at.isoformat()}|{seq}|{row_id}".encode()
+    ).decode()
+
+
+def _decode_cursor(cursor: str) -> _Key | None:
+    try:
+        created_at, seq, row_id = (
+            pybase64.urlsafe_b64decode(cursor).decode().split("|", 2)
+        )
+        return datetime.fromisoformat(created_at), int(seq), row_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+class _KeysetIndex(Generic[_Row]):
+    """Rows kept sorted by (created_at, insertion order) for bisected paging.
+
+    Ties on created_at keep the order rows were first inserted in, since ids
+    are random. Cursors encode the sort key of the last row, so a page can
+    still be located after that row has been deleted. Plain row ids are
+    accepted too. With ``max_rows`` set, inserting past the cap evicts the
+    oldest rows.
+    """
+
+    def __init__(self, max_rows: int | None = None) -> None:
+        self.rows: dict[str, _Row] = {}
+        self._keys: list[_Key] = []
+        # row id -> insertion sequence number, kept across upserts
+        self._seqs: dict[str, int] = {}
+        self._next_seq = itertools.count()
+        self._max_rows = max_rows
+
+    def _key(self, row: _Row) -> _Key:
+        return (row.created_at, self._seqs[row.id], row.id)
+
+    def upsert(self, row: _Row) -> None:
+        previous = self.rows.get(row.id)
+        self.rows[row.id] = row
+        if previous is not None:
+            if previous.created_at == row.created_at:
+                return
+            self._discard(self._key(previous))
+        else:
+            self._seqs[row.id] = next(self._next_seq)
+        insort(self._keys, self._key(row))
+        if self._max_rows is not None and len(self._keys) > self._max_rows:
+            _, _, oldest_id = self._keys.pop(0)
+            del self.rows[oldest_id]
+            del self._seqs[oldest_id]
+
+    def remove(self, row_id: str) -> None:
+        row = self.rows.pop(row_id, None)
+        if row is not None:
+            self._discard((row.created_at, self._seqs.pop(row_id), row_id))
+
+    def _discard(self, key: _Key) -> None:
+        del self._keys[bisect_left(self._keys, key)]
+
+    def _cursor_key(self, after: str) -> _Key | None:
+        row = self.rows.get(after)
+        if row is not None:
+            return self._key(row)
+        return _decode_cursor(after)
+
+    def page(self, after: str | None, limit: int, order: str) -> Page[_Row]:
+        keys = self._keys
+        cursor = self._cursor_key(after) if after else None
+        if order == "desc":
+            end = bisect_left(keys, cursor) if cursor else len(keys)
+            start = max(end - limit, 0)
+            page_keys = keys[start:end][::-1]
+            has_more = start > 0
+        else:
+            start = bisect_right(keys, cursor) if cursor else 0
+            page_keys = keys[start : start + limit]
+            has_more = start + limit < len(keys)
+        next_after = _encode_cursor(page_keys[-1]) if has_more and page_keys else None
+        return Page(
+            data=[self.rows[row_id] for _, _, row_id in page_keys],
+            has_more=has_more,
+            after=next_after,
+        )
+
+
 class MemoryStore(Store[dict]):
+    # Seconds to wait for more attachment changes before writing the index
+    PERSIST_DELAY = 0.1
+    # Oldest items beyond this are dropped so a thread's memory stays bounded
+    MAX_ITEMS_PER_THREAD = 10_000
+
     def __init__(self):
-        self.threads: dict[str, ThreadMetadata] = {}
-        self.items: dict[str, list[ThreadItem]] = defaultdict(list)
+        # Threads indexed by id and kept sorted by (created_at, insertion order)
+        self.threads: _KeysetIndex[ThreadMetadata] = _KeysetIndex()
+        # thread_id -> items of that thread, indexed by id and sort key
+        self.items: dict[str, _KeysetIndex[ThreadItem]] = defaultdict(
+            lambda: _KeysetIndex(max_rows=self.MAX_ITEMS_PER_THREAD)
+        )
         self.attachments: dict[str, Attachment] = {}
+        # Already-dumped attachments, so a write only re-dumps what changed
+        self._serialized_attachments: dict[str, dict] = {}
         self._attachment_index_path = (
             Path(__file__).resolve().parents[2] / "data" / "attachments" / "index.json"
         )
         self._attachment_index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._persist_task: asyncio.Task[None] | None = None
+        self._persist_lock = asyncio.Lock()
+        # mtime of the index as last read or written, to skip unchanged reloads
+        self._index_mtime_ns: int | None = None
         self._load_attachments_from_disk()
 
     async def load_thread(self, thread_id: str, context: dict) -> ThreadMetadata:
-        if thread_id not in self.threads:
+        thread = self.threads.rows.get(thread_id)
+        if thread is None:
             raise NotFoundError(f"Thread {thread_id} not found")
-        return self.threads[thread_id]
+        return thread
 
     async def save_thread(self, thread: ThreadMetadata, context: dict) -> None:
-        self.threads[thread.id] = thread
+        self.threads.upsert(thread)
 
     async def load_threads(
         self, limit: int, after: str | None, order: str, context: dict
     ) -> Page[ThreadMetadata]:
-        threads = list(self.threads.values())
-        return self._paginate(
-            threads, after, limit, order, sort_key=lambda t: t.created_at, cursor_key=lambda t: t.id
-        )
+        return self.threads.page(after, limit, order)
 
     async def load_thread_items(
         self, thread_id: str, after: str | None, limit: int, order: str, context: dict
     ) -> Page[ThreadItem]:
-        items = self.items.get(thread_id, [])
-        return self._paginate(
-            items, after, limit, order, sort_key=lambda i: i.created_at, cursor_key=lambda i: i.id
-        )
+        items = self.items.get(thread_id)
+        if items is None:
+            return Page(data=[], has_more=False, after=None)
+        return items.page(after, limit, order)
 
     async def add_thread_item(self, thread_id: str, item: ThreadItem, context: dict) -> None:
-        self.items[thread_id].append(item)
+        self.items[thread_id].upsert(item)
 
     async def save_item(self, thread_id: str, item: ThreadItem, context: dict) -> None:
-        items = self.items[thread_id]
-        for idx, existing in enumerate(items):
-            if existing.id == item.id:
-                items[idx] = item
-                return
-        items.append(item)
+        self.items[thread_id].upsert(item)
 
     async def load_item(self, thread_id: str, item_id: str, context: dict) -> ThreadItem:
-        for item in self.items.get(thread_id, []):
-            if item.id == item_id:
-                return item
-        raise NotFoundError(f"Item {item_id} not found in thread {thread_id}")
+        items = self.items.get(thread_id)
+        item = items.rows.get(item_id) if items is not None else None
+        if item is None:
+            raise NotFoundError(f"Item {item_id} not found in thread {thread_id}")
+        return item
 
     async def delete_thread(self, thread_id: str, context: dict) -> None:
-        self.threads.pop(thread_id, None)
+        self.threads.remove(thread_id)
         self.items.pop(thread_id, None)
 
     async def delete_thread_item(self, thread_id: str, item_id: str, context: dict) -> None:
-        self.items[thread_id] = [
-            item for item in self.items.get(thread_id, []) if item.id != item_id
-        ]
-
-    def _paginate(
-        self, rows: list, after: str | None, limit: int, order: str, sort_key, cursor_key
-    ):
-        sorted_rows = sorted(rows, key=sort_key, reverse=order == "desc")
-        start = 0
-        if after:
-            for idx, row in enumerate(sorted_rows):
-                if cursor_key(row) == after:
-                    start = idx + 1
-                    break
-        data = sorted_rows[start : start + limit]
-        has_more = start + limit < len(sorted_rows)
-        next_after = cursor_key(data[-1]) if has_more and data else None
-        return Page(data=data, has_more=has_more, after=next_after)
+        items = self.items.get(thread_id)
+        if items is not None:
+            items.remove(item_id)
 
     # Attachments are not implemented in this store
 
     async def save_attachment(self, attachment: Attachment, context: dict) -> None:
         self.attachments[attachment.id] = attachment
-        self._persist_attachments()
+        self._serialized_attachments[attachment.id] = attachment.model_dump()
+        self._schedule_persist()
 
     async def load_attachment(self, attachment_id: str, context: dict) -> Attachment:
         attachment = self.attachments.get(attachment_id)
-        if attachment is None:
+        # Memory is authoritative while a write is pending; otherwise pick up
+        # attachments saved to the index by another process
+        if attachment is None and self._persist_task is None:
             self._load_attachments_from_disk()
             attachment = self.attachments.get(attachment_id)
         if attachment is None:
@@ -107,27 +207,66 @@ class MemoryStore(Store[dict]):
 
     async def delete_attachment(self, attachment_id: str, context: dict) -> None:
         self.attachments.pop(attachment_id, None)
-        self._persist_attachments()
+        self._serialized_attachments.pop(attachment_id, None)
+        self._schedule_persist()
+
+    async def flush(self) -> None:
+        """Write any pending attachment index changes now."""
+        task = self._persist_task
+        if task is not None:
+            task.cancel()
+            self._persist_task = None
+            await self._persist_attachments()
 
     def _load_attachments_from_disk(self) -> None:
-        if not self._attachment_index_path.exists():
+        """Merge in attachments from the index file if it changed since last read.
+
+        A miss against an unchanged index costs one stat, not a full parse.
+        """
+        try:
+            mtime_ns = self._attachment_index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime_ns == self._index_mtime_ns:
             return
         try:
-            payload = json.loads(self._attachment_index_path.read_text())
-        except json.JSONDecodeError:
+            payload = orjson.loads(self._attachment_index_path.read_bytes())
+        except orjson.JSONDecodeError:
             return
-        adapter = TypeAdapter(Attachment)
-        attachments: dict[str, Attachment] = {}
+        self._index_mtime_ns = mtime_ns
         for attachment_id, data in payload.items():
+            if attachment_id in self.attachments:
+                continue
             try:
-                attachments[attachment_id] = adapter.validate_python(data)
+                self.attachments[attachment_id] = _ATTACHMENT_ADAPTER.validate_python(data)
             except Exception:
                 continue
-        self.attachments = attachments
-
-    def _persist_attachments(self) -> None:
-        data = {
-            attachment_id: attachment.model_dump(mode="json")
-            for attachment_id, attachment in self.attachments.items()
-        }
-        self._attachment_index_path.write_text(json.dumps(data, indent=2))
+            self._serialized_attachments[attachment_id] = data
+
+    def _schedule_persist(self) -> None:
+        """Coalesce index writes from a burst of saves into one."""
+        if self._persist_task is None:
+            self._persist_task = asyncio.create_task(self._persist_after_delay())
+
+    async def _persist_after_delay(self) -> None:
+        await asyncio.sleep(self.PERSIST_DELAY)
+        self._persist_task = None
+        await self._persist_attachments()
+
+    async def _persist_attachments(self) -> None:
+        # Snapshot on the event loop; encode and write in a worker thread
+        async with self._persist_lock:
+            data = dict(self._serialized_attachments)
+            # Our own writes don't need to be read back
+            self._index_mtime_ns = await asyncio.to_thread(
+                _write_attachment_index, self._attachment_index_path, data
+            )
+
+
+def _write_attachment_index(path: Path, data: dict[str, dict]) -> int:
+    """Atomically write the index and return its new mtime (ns)."""
+    # orjson handles datetimes natively; default=str covers URL types
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+    return path.stat().st_mtime_ns
@@ -4,10 +4,11 @@ VideoAssistantServer implements the ChatKit server interface.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 from agents import Runner
 from chatkit.agents import stream_agent_response
@@ -32,11 +33,17 @@ from .attachments import attachment_to_message_content
 from .memory_store import MemoryStore
 from .thread_item_converter import BasicThreadItemConverter
 from .video_agent import VideoAgentContext, video_agent
+from .video_project_state import VideoProjectState
 from .video_project_store import VideoProjectStore
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Gap between items created by the same action, so they sort in order
+_ITEM_TICK = timedelta(microseconds=1)
+
+# Streamed events between cooperative yields to the event loop
+_STREAM_YIELD_EVERY = 16
+
 
 class VideoAssistantServer(ChatKitServer[dict[str, Any]]):
     """ChatKit server for video generation workflows."""
@@ -51,7 +58,12 @@ class VideoAssistantServer(ChatKitServer[dict[str, Any]]):
 
         # Domain-specific store for video project state
         self.project_store = VideoProjectStore()
-        self.thread_item_converter = BasicThreadItemConverter()
+        self.thread_item_converter = BasicThreadItemConverter(self.attachment_store)
+
+    async def aclose(self) -> None:
+        """Release resources and flush pending attachment index writes."""
+        await self.attachment_store.aclose()
+        await self.store.flush()
 
     async def action(
         self,
@@ -63,23 +75,10 @@ class VideoAssistantServer(ChatKitServer[dict[str, Any]]):
         """Handle widget actions like video selection and storyboard approval."""
         logger.info("[ACTION] type=%s", action.type)
 
-        if action.type == "video.approve_storyboard":
-            async for event in self._handle_approve_storyboard(
-                thread, action.payload, sender, context
-            ):
-                yield event
-            return
-
-        if action.type == "video.select_segment":
-            async for event in self._handle_select_segment(
-                thread, action.payload, sender, context
-            ):
-                yield event
-            return
-
-        if action.type == "video.regenerate_segment":
-            async for event in self._handle_regenerate_segment(
-                thread, action.payload, sender, context
+        reply_for = _ACTION_REPLIES.get(action.type)
+        if reply_for is not None:
+            async for event in self._emit_action(
+                thread, context, *reply_for(action.payload)
             ):
                 yield event
             return
@@ -114,8 +113,10 @@ class VideoAssistantServer(ChatKitServer[dict[str, Any]]):
             context=context,
         )
 
-        # Runner expects the most recent message to be last
-        items = list(reversed(items_page.data))
+        # Runner expects the most recent message to be last. The page is the
+        # newest 50 (so it can't be fetched ascending); flip it in place
+        items = items_page.data
+        items.reverse()
 
         # Translate ChatKit thread items into agent input
         input_items = await self.thread_item_converter.to_agent_input(items)
@@ -127,9 +128,15 @@ class VideoAssistantServer(ChatKitServer[dict[str, Any]]):
             context=agent_context,
         )
 
-        # Stream agent response events
+        # Stream agent response events. A burst of already-buffered events
+        # never suspends, so hand control back to the loop periodically to
+        # keep other streams moving (a pure yield, never a timed sleep)
+        count = 0
         async for event in stream_agent_response(agent_context, result):
             yield event
+            count += 1
+            if count % _STREAM_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
 
     def get_stream_options(
         self, thread: ThreadMetadata, context: dict[str, Any]
@@ -140,90 +147,92 @@ class VideoAssistantServer(ChatKitServer[dict[str, Any]]):
 
     async def to_message_content(self, _input: Attachment) -> ResponseInputContentParam:
         """Convert attachments to message content."""
-        return attachment_to_message_content(_input)
+        # No request context is passed here; the memory store ignores it
+        _input = await self.attachment_store.ensure_file_reference(_input, context={})
+        return await asyncio.to_thread(attachment_to_message_content, _input)
 
     # --- Private action handlers ---
 
-    async def _handle_approve_storyboard(
+    async def _emit_action(
         self,
         thread: ThreadMetadata,
-        payload: dict[str, Any],
-        sender: WidgetItem | None,
         context: dict[str, Any],
+        hidden: str,
+        message: str,
+        mutator: Callable[[VideoProjectState], None] | None = None,
     ) -> AsyncIterator[ThreadStreamEvent]:
-        """Handle storyboard approval action."""
-        logger.info("[ACTION] approve_storyboard")
-
-        state = await self.project_store.load(thread.id)
-
-        def mutate(s):
-            s.storyboard_approved = True
-            s.touch()
-
-        state = await self.project_store.mutate(thread.id, mutate)
-
-        # Add hidden context
-        await self.store.add_thread_item(
-            thread.id,
-            HiddenContextItem(
-                id=self.store.generate_item_id("message", thread, context),
-                thread_id=thread.id,
-                created_at=datetime.now(),
-                content="<STORYBOARD_APPROVED></STORYBOARD_APPROVED>",
-            ),
-            context=context,
+        """Apply an action: update state, record hidden context, confirm to the user."""
+        # One clock read per action; the reply is stamped just after the
+        # hidden context so the two keep their order in the thread. Items
+        # below are built from known-valid values, so validation is skipped
+        now = datetime.now()
+
+        if mutator is not None:
+            await self.project_store.mutate(thread.id, mutator)
+
+        # Add hidden context in the background while the reply is sent
+        add_hidden = asyncio.create_task(
+            self.store.add_thread_item(
+                thread.id,
+                HiddenContextItem.model_construct(
+                    id=self.store.generate_item_id("message", thread, context),
+                    thread_id=thread.id,
+                    created_at=now,
+                    content=hidden,
+                ),
+                context=context,
+            )
         )
 
         # Send confirmation message
-        message_item = AssistantMessageItem(
+        message_item = AssistantMessageItem.model_construct(
             id=self.store.generate_item_id("message", thread, context),
             thread_id=thread.id,
-            created_at=datetime.now(),
-            content=[
-                AssistantMessageContent(
-                    text="Storyboard approved! Starting video generation..."
-                )
-            ],
+            created_at=now + _ITEM_TICK,
+            content=[AssistantMessageContent.model_construct(text=message)],
         )
-        yield ThreadItemDoneEvent(item=message_item)
+        try:
+            yield ThreadItemDoneEvent(item=message_item)
+        finally:
+            await add_hidden
 
-    async def _handle_regenerate_segment(
-        self,
-        thread: ThreadMetadata,
-        payload: dict[str, Any],
-        sender: WidgetItem | None,
-        context: dict[str, Any],
-    ) -> AsyncIterator[ThreadStreamEvent]:
-        """Handle segment regeneration request."""
-        segment_id = payload.get("segment_id")
-        logger.info("[ACTION] regenerate_segment: %s", segment_id)
 
-        # Add hidden context
-        await self.store.add_thread_item(
-            thread.id,
-            HiddenContextItem(
-                id=self.store.generate_item_id("message", thread, context),
-                thread_id=thread.id,
-                created_at=datetime.now(),
-                content=f"<REGENERATE_SEGMENT>{segment_id}</REGENERATE_SEGMENT>",
-            ),
-            context=context,
-        )
+# (hidden context, confirmation message, optional state mutator)
+_ActionReply = tuple[str, str, Callable[[VideoProjectState], None] | None]
 
-        # Send confirmation message
-        message_item = AssistantMessageItem(
-            id=self.store.generate_item_id("message", thread, context),
-            thread_id=thread.id,
-            created_at=datetime.now(),
-            content=[
-                AssistantMessageContent(
-                    text=f"Regenerating video for segment {segment_id}..."
-                )
-            ],
-        )
-        yield ThreadItemDoneEvent(item=message_item)
+
+def _approve_storyboard_reply(payload: dict[str, Any]) -> _ActionReply:
+    """Handle storyboard approval action."""
+    logger.info("[ACTION] approve_storyboard")
+    return (
+        "<STORYBOARD_APPROVED></STORYBOARD_APPROVED>",
+        "Storyboard approved! Starting video generation...",
+        VideoProjectState.approve_storyboard,
+    )
+
+
+def _regenerate_segment_reply(payload: dict[str, Any]) -> _ActionReply:
+    """Handle segment regeneration request."""
+    segment_id = payload.get("segment_id")
+    logger.info("[ACTION] regenerate_segment: %s", segment_id)
+    return (
+        f"<REGENERATE_SEGMENT>{segment_id}</REGENERATE_SEGMENT>",
+        f"Regenerating video for segment {segment_id}...",
+        None,
+    )
+
+
+_ACTION_REPLIES: dict[str, Callable[[dict[str, Any]], _ActionReply]] = {
+    "video.approve_storyboard": _approve_storyboard_reply,
+    "video.regenerate_segment": _regenerate_segment_reply,
+}
 
 
 def create_chatkit_server() -> VideoAssistantServer | None:
     """Return a configured ChatKit server instance."""
     return VideoAssistantServer()
+
+
+async def create_chatkit_server_async() -> VideoAssistantServer | None:
+    """Build the ChatKit server off the event loop (it touches the filesystem)."""
+    return await asyncio.to_thread(create_chatkit_server)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from inspect import cleandoc
 
 from agents import TResponseInputItem
@@ -17,16 +18,34 @@ from openai.types.responses import ResponseInputContentParam, ResponseInputTextP
 from openai.types.responses.response_input_item_param import Message
 from typing_extensions import assert_never
 
-from .attachments import attachment_to_message_content, attachment_to_message_contents
+from .attachment_store import LocalAttachmentStore
+from .attachments import attachment_to_message_content, attachments_to_message_contents
 
 
 class BasicThreadItemConverter(ThreadItemConverter):
     """Adds HiddenContextItem support and attachment path info for storyboard generation."""
 
+    def __init__(self, attachment_store: LocalAttachmentStore) -> None:
+        self.attachment_store = attachment_store
+
+    async def _with_file_reference(self, attachment: Attachment) -> Attachment:
+        # No request context reaches the converter; the memory store ignores it
+        return await self.attachment_store.ensure_file_reference(attachment, context={})
+
     async def attachment_to_message_content(
         self, attachment: Attachment
     ) -> ResponseInputContentParam:
-        return attachment_to_message_content(attachment)
+        attachment = await self._with_file_reference(attachment)
+        # Encoding reads the file from disk, keep it off the event loop
+        return await asyncio.to_thread(attachment_to_message_content, attachment)
+
+    async def _attachments_to_message_contents(
+        self, attachments: list[Attachment]
+    ) -> list[ResponseInputContentParam]:
+        resolved = await asyncio.gather(
+            *(self._with_file_reference(a) for a in attachments)
+        )
+        return await attachments_to_message_contents(list(resolved))
 
     async def hidden_context_to_input(self, item: HiddenContextItem):
         return Message(
@@ -61,10 +80,17 @@ class BasicThreadItemConverter(ThreadItemConverter):
             else:
                 assert_never(part)
 
+        # Dedupe tags by text, keeping the first occurrence and its position
+        uniq_tags: dict[str, UserMessageTagContent] = {}
+        for tag in raw_tags:
+            uniq_tags.setdefault(tag.text, tag)
+
         # Build attachment content parts (includes path info + actual content)
-        attachment_parts: list[ResponseInputContentParam] = []
-        for attachment in item.attachments:
-            attachment_parts.extend(attachment_to_message_contents(attachment))
+        # and resolve tags concurrently
+        attachment_parts, tag_content = await asyncio.gather(
+            self._attachments_to_message_contents(item.attachments),
+            asyncio.gather(*(self.tag_to_message_content(t) for t in uniq_tags.values())),
+        )
 
         user_text_item = Message(
             role="user",
@@ -94,35 +120,24 @@ class BasicThreadItemConverter(ThreadItemConverter):
                 )
             )
 
-        # Dedupe tags (preserve order) and resolve to message content
-        if raw_tags:
-            seen, uniq_tags = set(), []
-            for t in raw_tags:
-                if t.text not in seen:
-                    seen.add(t.text)
-                    uniq_tags.append(t)
-
-            tag_content = [
-                await self.tag_to_message_content(tag) for tag in uniq_tags
-            ]
-
-            if tag_content:
-                context_items.append(
-                    Message(
-                        role="user",
-                        type="message",
-                        content=[
-                            ResponseInputTextParam(
-                                type="input_text",
-                                text=cleandoc("""
-                                    # User-provided context for @-mentions
-                                    - When referencing resolved entities, use their canonical names **without** '@'.
-                                    - The '@' form appears only in user text and should not be echoed.
-                                """).strip(),
-                            ),
-                            *tag_content,
-                        ],
-                    )
+        # @-mention context from the resolved tags
+        if tag_content:
+            context_items.append(
+                Message(
+                    role="user",
+                    type="message",
+                    content=[
+                        ResponseInputTextParam(
+                            type="input_text",
+                            text=cleandoc("""
+                                # User-provided context for @-mentions
+                                - When referencing resolved entities, use their canonical names **without** '@'.
+                                - The '@' form appears only in user text and should not be echoed.
+                            """).strip(),
+                        ),
+                        *tag_content,
+                    ],
                 )
+            )
 
         return [user_text_item, *context_items]
@@ -1,10 +1,8 @@
 """Video generation tool that converts VideoProjectState to VideoGenerations."""
 
 import asyncio
-import base64
-import mimetypes
+import functools
 import os
-from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal
 
@@ -21,7 +19,74 @@ from app.integrations.video_generation import (
     VideoGenerationInput,
     VideoGenerationService,
 )
-from app.video_project_state import GenerationInput, ImageInput as ProjectImageInput, VideoProjectState
+from app.integrations.video_generation.providers.base import (
+    iso_now,
+    nearest_duration_map,
+)
+from app.video_project_state import (
+    GenerationInput,
+    ImageInput as ProjectImageInput,
+    Segment,
+    VideoProjectState,
+)
+
+
+# How long a status poll waits for downloads before returning
+_DOWNLOAD_WAIT_SECONDS = 1.0
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Image types the providers accept, by file extension; anything else is sent as PNG
+_IMAGE_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+}
+
+# Relative to the project root; formatted in one go instead of joining each level
+_VIDEO_PATH_TEMPLATE = (
+    "data/video_generations_result_{project_id}/segment_{segment_index}/"
+    "generation_result_{input_index}/generated_video_{video_id}.mp4"
+)
+
+# Output path -> in-flight download, so repeated polls don't download twice
+_download_tasks: dict[Path, asyncio.Task[str | None]] = {}
+
+# Downloads outlive the poll that started them, so the limit is process-wide
+_MAX_CONCURRENT_DOWNLOADS = 4
+_download_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
+
+# Shared by all downloads; background downloads outlive a single poll call
+_download_client: httpx.AsyncClient | None = None
+
+
+def _get_download_client() -> httpx.AsyncClient:
+    """Get the shared HTTP/2 download client, creating it on first use.
+
+    Downloads from the same CDN hosts reuse pooled connections instead of
+    paying a TCP+TLS handshake per video.
+    """
+    global _download_client
+    if _download_client is None or _download_client.is_closed:
+        _download_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            follow_redirects=True,
+        )
+    return _download_client
+
+
+async def aclose_downloads() -> None:
+    """Cancel in-flight downloads and close the shared download client."""
+    global _download_client
+    tasks = list(_download_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if _download_client is not None:
+        await _download_client.aclose()
+        _download_client = None
 
 
 class SegmentGeneration(BaseModel):
@@ -54,38 +119,61 @@ class VideoGenerations(BaseModel):
     )
 
 
-def _convert_project_image_to_api_input(project_image: ProjectImageInput) -> ImageInput:
-    """Convert a ProjectImageInput (file_path) to API ImageInput (base64).
+@functools.lru_cache(maxsize=64)
+def _read_image_cached(file_path: str, mtime_ns: int, size: int) -> bytes:
+    """Read an image once per (path, mtime, size); edits to the file bust the key."""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def _load_local_image(file_path: str) -> bytes:
+    """Blocking stat + cached read; run on a worker thread."""
+    st = os.stat(file_path)
+    return _read_image_cached(file_path, st.st_mtime_ns, st.st_size)
+
+
+async def _convert_project_image_to_api_input(
+    project_image: ProjectImageInput,
+) -> ImageInput:
+    """Convert a ProjectImageInput (file_path) to API ImageInput.
 
-    Reads the image file from the local file path and converts it to base64
-    for sending to video generation providers.
+    Local files are read into memory once and shared as raw bytes, so a
+    character reference reused across inputs and segments costs one read
+    and no base64 round-trip. The read runs on a worker thread to keep the
+    event loop free. HTTP(S) URLs are passed through as URLs.
     """
     file_path = project_image.file_path
+    if file_path.startswith(("http://", "https://")):
+        return ImageInput(url=file_path)
 
     # Determine MIME type from file extension
-    mime_type, _ = mimetypes.guess_type(file_path)
-    if mime_type not in ("image/jpeg", "image/png", "image/webp"):
-        mime_type = "image/png"  # Default to PNG if unknown
+    extension = os.path.splitext(file_path)[1].lower()
+    mime_type = _IMAGE_MIME_TYPES.get(extension, "image/png")  # Default to PNG if unknown
 
-    # Read file and encode as base64
-    with open(file_path, "rb") as f:
-        image_data = f.read()
-
-    base64_data = base64.b64encode(image_data).decode("utf-8")
-
-    return ImageInput(base64=base64_data, mime_type=mime_type)  # type: ignore
+    try:
+        image_bytes = await asyncio.to_thread(_load_local_image, file_path)
+    except OSError:
+        # Let the provider report the unreadable file for this input only
+        return ImageInput(path=file_path, mime_type=mime_type)  # type: ignore
+    return ImageInput(raw_bytes=image_bytes, mime_type=mime_type)  # type: ignore
 
 
-def _convert_generation_input_to_provider_input(
+async def _convert_generation_input_to_provider_input(
     gen_input: GenerationInput,
 ) -> VideoGenerationInput:
     """Convert GenerationInput from VideoProjectState to SoraInput or VeoInput."""
     provider = gen_input.provider
 
-    # Convert input_image if present
-    input_image: ImageInput | None = None
+    # Convert input_image and any veo reference_images concurrently
+    project_images = list(gen_input.reference_images or []) if provider == "veo" else []
     if gen_input.input_image:
-        input_image = _convert_project_image_to_api_input(gen_input.input_image)
+        project_images.insert(0, gen_input.input_image)
+    images = list(
+        await asyncio.gather(
+            *(_convert_project_image_to_api_input(img) for img in project_images)
+        )
+    )
+    input_image: ImageInput | None = images.pop(0) if gen_input.input_image else None
 
     if provider == "sora":
         return SoraInput(
@@ -94,13 +182,7 @@ def _convert_generation_input_to_provider_input(
             input_image=input_image,
         )
     elif provider == "veo":
-        # Convert reference_images if present
-        reference_images: list[ImageInput] | None = None
-        if gen_input.reference_images:
-            reference_images = [
-                _convert_project_image_to_api_input(img)
-                for img in gen_input.reference_images
-            ]
+        reference_images: list[ImageInput] | None = images or None
 
         return VeoInput(
             provider="veo",
@@ -128,19 +210,21 @@ def _derive_segment_status(
     - If all are done (completed/failed) and at least one completed → completed
     - If all failed → failed
     """
-    if not results:
-        return "pending"
-
-    statuses = [r.video.status for r in results]
-
-    # Still processing
-    if any(s in ("in_progress", "queued") for s in statuses):
-        return "in_progress"
+    has_completed = has_failed = False
+    for result in results:
+        status = result.video.status
+        # Still processing
+        if status == "in_progress" or status == "queued":
+            return "in_progress"
+        if status == "completed":
+            has_completed = True
+        elif status == "failed":
+            has_failed = True
 
     # All done - check if at least one completed
-    if any(s == "completed" for s in statuses):
+    if has_completed:
         return "completed"
-    if any(s == "failed" for s in statuses):
+    if has_failed:
         return "failed"
     return "pending"
 
@@ -154,29 +238,77 @@ def _derive_overall_status(
     - If all are done (completed/failed) and at least one completed → completed
     - If all failed → failed
     """
-    if not segments:
-        return "pending"
-
-    statuses = [s.status for s in segments]
-
-    # Still processing
-    if any(s == "in_progress" for s in statuses):
-        return "in_progress"
+    has_completed = has_failed = False
+    for segment in segments:
+        status = segment.status
+        # Still processing
+        if status == "in_progress":
+            return "in_progress"
+        if status == "completed":
+            has_completed = True
+        elif status == "failed":
+            has_failed = True
 
     # All done - check if at least one completed
-    if any(s == "completed" for s in statuses):
+    if has_completed:
         return "completed"
-    if any(s == "failed" for s in statuses):
+    if has_failed:
         return "failed"
     return "pending"
 
 
+_SUPPORTED_DURATIONS = (4, 6, 8)
+_DURATION_MAP = nearest_duration_map(_SUPPORTED_DURATIONS, _SUPPORTED_DURATIONS[-1])
+
+
 def _get_validated_duration(duration: float) -> int:
     """Convert and validate duration to an integer supported by providers."""
-    # Round to nearest supported duration (4, 6, 8)
+    # Round to nearest supported duration (4, 6, 8); out-of-range values clamp
     duration_int = int(round(duration))
-    supported = [4, 6, 8]
-    return min(supported, key=lambda x: abs(x - duration_int))
+    clamped = min(max(duration_int, _SUPPORTED_DURATIONS[0]), _SUPPORTED_DURATIONS[-1])
+    return _DURATION_MAP[clamped]
+
+
+async def _convert_segment_inputs(segment: Segment) -> list[VideoGenerationInput]:
+    """Convert every generation input of one segment concurrently."""
+    return list(
+        await asyncio.gather(
+            *(
+                _convert_generation_input_to_provider_input(gen_input)
+                for gen_input in segment.generation_inputs
+            )
+        )
+    )
+
+
+async def _generate_one_segment(
+    segment_index: int,
+    segment: Segment,
+    provider_inputs: list[VideoGenerationInput],
+    aspect_ratio: str,
+    service: VideoGenerationService,
+    semaphore: asyncio.Semaphore,
+) -> SegmentGeneration:
+    """Submit every generation input of one segment as a single batch."""
+    config = GenerationConfig(
+        duration=_get_validated_duration(segment.duration),
+        aspect_ratio=aspect_ratio,  # type: ignore
+    )
+    inputs = [
+        (provider_input, input_index)
+        for input_index, provider_input in enumerate(provider_inputs)
+    ]
+
+    async with semaphore:
+        results = await service.generate_batch(inputs, config) if inputs else []
+
+    # Built from already-validated results, so skip re-validation
+    return SegmentGeneration.model_construct(
+        segment_index=segment_index,
+        scene_description=segment.scene_description,
+        status=_derive_segment_status(results),
+        generation_results=results,
+    )
 
 
 async def generate_videos_from_project(
@@ -184,17 +316,20 @@ async def generate_videos_from_project(
     state: VideoProjectState,
     wait_for_completion: bool = False,
     service: VideoGenerationService | None = None,
+    max_concurrent_segments: int = 5,
 ) -> VideoGenerations:
     """
     Generate videos for all segments in a VideoProjectState.
 
-    All video generation requests are made concurrently for maximum parallelism.
+    Each segment's inputs are submitted as one batch, and up to
+    max_concurrent_segments segments are submitted concurrently.
 
     Args:
         project_id: Unique identifier for this project
         state: The VideoProjectState containing storyboard
         wait_for_completion: If True, poll until all videos complete
         service: Optional VideoGenerationService instance. Creates one if not provided.
+        max_concurrent_segments: Maximum number of segment batches in flight
 
     Returns:
         VideoGenerations with results for each segment
@@ -202,102 +337,73 @@ async def generate_videos_from_project(
     if service is None:
         service = VideoGenerationService()
 
-    created_at = datetime.now(UTC).isoformat()
-
-    # Collect all inputs from all segments for concurrent generation
-    # Each item: (segment_index, input_index, provider_input, config)
-    all_inputs: list[tuple[int, int, VideoGenerationInput, GenerationConfig]] = []
+    created_at = iso_now()
 
     aspect_ratio = (
         state.aspect_ratio if state.aspect_ratio in ("16:9", "9:16") else "9:16"
     )
 
-    for segment_index, segment in enumerate(state.storyboard.segments):
-        duration = _get_validated_duration(segment.duration)
-        config = GenerationConfig(
-            duration=duration,
-            aspect_ratio=aspect_ratio,  # type: ignore
-        )
-
-        for input_index, gen_input in enumerate(segment.generation_inputs):
-            provider_input = _convert_generation_input_to_provider_input(gen_input)
-            all_inputs.append((segment_index, input_index, provider_input, config))
-
-    # Generate ALL videos concurrently
-    async def generate_one(
-        segment_idx: int, input_idx: int, provider_input: VideoGenerationInput, config: GenerationConfig
-    ) -> tuple[int, GenerationResult]:
-        """Generate a single video and return with segment index."""
-        video = await service.generate(provider_input, config)
-        result = GenerationResult(
-            input_index=input_idx,
-            provider=provider_input.provider,  # type: ignore
-            video=video,
-        )
-        return segment_idx, result
+    # Load all input images up front (off the event loop), so segments are
+    # then submitted in storyboard order
+    storyboard_segments = state.storyboard.segments
+    segment_inputs = await asyncio.gather(
+        *(_convert_segment_inputs(segment) for segment in storyboard_segments)
+    )
 
-    # Run all generations concurrently
-    tasks = [
-        generate_one(seg_idx, inp_idx, provider_input, config)
-        for seg_idx, inp_idx, provider_input, config in all_inputs
-    ]
-    all_results = await asyncio.gather(*tasks)
-
-    # Organize results by segment
-    segment_results: dict[int, list[GenerationResult]] = {}
-    for segment_idx, result in all_results:
-        if segment_idx not in segment_results:
-            segment_results[segment_idx] = []
-        segment_results[segment_idx].append(result)
-
-    # Build segments list
-    segments: list[SegmentGeneration] = []
-    for segment_index, segment in enumerate(state.storyboard.segments):
-        results = segment_results.get(segment_index, [])
-        # Sort by input_index to maintain order
-        results.sort(key=lambda r: r.input_index)
-        segment_status = _derive_segment_status(results)
-
-        segments.append(
-            SegmentGeneration(
-                segment_index=segment_index,
-                scene_description=segment.scene_description,
-                status=segment_status,
-                generation_results=results,
+    semaphore = asyncio.Semaphore(max_concurrent_segments)
+    segments: list[SegmentGeneration] = list(
+        await asyncio.gather(
+            *(
+                _generate_one_segment(
+                    segment_index,
+                    segment,
+                    provider_inputs,
+                    aspect_ratio,
+                    service,
+                    semaphore,
+                )
+                for segment_index, (segment, provider_inputs) in enumerate(
+                    zip(storyboard_segments, segment_inputs)
+                )
             )
         )
+    )
 
     # Wait for completion if requested
     if wait_for_completion and segments:
-        # Collect all video IDs to wait for
+        # Collect all video IDs to wait for, remembering where each one lives
         videos_to_wait: list[tuple[Literal["sora", "veo"], str, int]] = []
-        for seg in segments:
-            for result in seg.generation_results:
+        positions: dict[tuple[str, str], tuple[int, int]] = {}
+        for seg_idx, seg in enumerate(segments):
+            for res_idx, result in enumerate(seg.generation_results):
+                # Failed submissions have no provider id to poll
+                if result.video.status == "failed":
+                    continue
                 videos_to_wait.append(
                     (result.provider, result.video.id, result.input_index)
                 )
+                positions[(result.provider, result.video.id)] = (seg_idx, res_idx)
 
         if videos_to_wait:
             completed_results = await service.wait_for_batch(videos_to_wait)
 
-            # Update results with completed statuses
-            result_map = {(r.provider, r.video.id): r for r in completed_results}
+            # Write completed results back in place
+            touched: set[int] = set()
+            for completed in completed_results:
+                position = positions.get((completed.provider, completed.video.id))
+                if position is not None:
+                    seg_idx, res_idx = position
+                    segments[seg_idx].generation_results[res_idx] = completed
+                    touched.add(seg_idx)
 
-            for seg in segments:
-                updated_results = []
-                for result in seg.generation_results:
-                    key = (result.provider, result.video.id)
-                    if key in result_map:
-                        updated_results.append(result_map[key])
-                    else:
-                        updated_results.append(result)
-                seg.generation_results = updated_results
-                seg.status = _derive_segment_status(updated_results)
+            for seg_idx in touched:
+                seg = segments[seg_idx]
+                seg.status = _derive_segment_status(seg.generation_results)
 
     # Derive overall status
     overall_status = _derive_overall_status(segments)
 
-    return VideoGenerations(
+    return VideoGenerations.model_construct(
         project_id=project_id,
         created_at=created_at,
         status=overall_status,
@@ -331,14 +437,14 @@ def get_video_local_path(
     Returns:
         Path to where the video should be saved
     """
-    root = Path(project_root)
-    return (
-        root
-        / "data"
-        / f"video_generations_result_{project_id}"
-        / f"segment_{segment_index}"
-        / f"generation_result_{input_index}"
-        / f"generated_video_{video_id}.mp4"
+    return Path(
+        project_root,
+        _VIDEO_PATH_TEMPLATE.format(
+            project_id=project_id,
+            segment_index=segment_index,
+            input_index=input_index,
+            video_id=video_id,
+        ),
     )
 
 
@@ -351,6 +457,9 @@ async def _download_video(
     """
     Download video from URL to local path.
 
+    The parent directory must already exist; poll_and_save_video_generations
+    creates it, batched per poll, before starting downloads.
+
     Args:
         url: Video download URL
         output_path: Local path to save the video
@@ -360,47 +469,126 @@ async def _download_video(
     Returns:
         Error message on failure, None on success
     """
+    part_path = output_path.with_name(output_path.name + ".part")
     try:
-        # Create parent directories
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Build headers
         headers: dict[str, str] = {}
         if provider == "sora" and api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
+        # Resume a download interrupted by a dropped connection or restart
+        try:
+            offset = (await asyncio.to_thread(part_path.stat)).st_size
+        except FileNotFoundError:
+            offset = 0
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        client = _get_download_client()
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.is_error:
+                await response.aread()
             response.raise_for_status()
 
-            # Write content to file
-            with open(output_path, "wb") as f:
-                f.write(response.content)
+            # Stream to a temp file so a partial download never looks
+            # like a finished video. Append only if the server honored the
+            # range; a plain 200 restarts from scratch.
+            mode = "ab" if response.status_code == 206 else "wb"
+            f = await asyncio.to_thread(open, part_path, mode)
+            try:
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, part_path, output_path)
 
         return None
     except httpx.HTTPStatusError as e:
+        # Includes 416 for a stale partial file; start over next time
+        part_path.unlink(missing_ok=True)
         return f"HTTP error {e.response.status_code}: {e.response.text[:200]}"
     except httpx.RequestError as e:
+        # Keep the partial file so the next poll resumes it
         return f"Request error: {str(e)}"
     except OSError as e:
+        part_path.unlink(missing_ok=True)
         return f"File error: {str(e)}"
+    except Exception as e:
+        # e.g. httpx.StreamError; report it on the video rather than
+        # failing the poll that reads this task's result
+        part_path.unlink(missing_ok=True)
+        return f"Download error: {str(e)}"
+
+
+def _list_files(directories: set[Path]) -> set[Path]:
+    """Return the files present in the given directories (missing ones are empty)."""
+    files: set[Path] = set()
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                files.update(directory / entry.name for entry in entries)
+        except OSError:
+            continue
+    return files
+
+
+def _make_dirs(directories: set[Path]) -> None:
+    """Create the given directories, skipping ones that can't be created."""
+    for directory in directories:
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # The download into it will report the file error
+            continue
+
+
+async def _limited_download(
+    url: str,
+    output_path: Path,
+    provider: Literal["sora", "veo"],
+    api_key: str | None,
+) -> str | None:
+    """Run a download once a slot in the shared download limit frees up."""
+    async with _download_semaphore:
+        return await _download_video(url, output_path, provider, api_key)
+
+
+def _start_download(
+    url: str,
+    output_path: Path,
+    provider: Literal["sora", "veo"],
+    api_key: str | None,
+) -> asyncio.Task[str | None]:
+    """Start a background download, or join the one already running for this path."""
+    task = _download_tasks.get(output_path)
+    if task is None:
+        task = asyncio.create_task(
+            _limited_download(url, output_path, provider, api_key)
+        )
+        _download_tasks[output_path] = task
+        task.add_done_callback(lambda _: _download_tasks.pop(output_path, None))
+    return task
 
 
 async def poll_and_save_video_generations(
     video_generations: VideoGenerations,
     project_root: Path | str,
     service: VideoGenerationService | None = None,
+    max_concurrent_status_checks: int = 16,
 ) -> VideoGenerations:
     """
     Check status of all video generations once and download completed videos.
 
     This function performs a single poll (no waiting/looping). Retry logic
-    should be handled externally by the caller.
+    should be handled externally by the caller. Downloads run in the
+    background; a video whose download is still running is reported as
+    in_progress (progress 100) until a later poll finds the file on disk.
 
     Args:
         video_generations: Current VideoGenerations state to check
         project_root: Root directory for saving downloaded videos
         service: Optional VideoGenerationService instance. Creates one if not provided.
+        max_concurrent_status_checks: Maximum number of status requests in flight
 
     Returns:
         Updated VideoGenerations with new statuses and downloaded videos
@@ -414,126 +602,166 @@ async def poll_and_save_video_generations(
     # Get OpenAI API key for Sora downloads
     openai_api_key = os.environ.get("OPENAI_API_KEY")
 
-    # Collect all videos that need status updates
-    videos_to_check: list[tuple[int, int, GenerationResult]] = []
-    for seg_idx, segment in enumerate(video_generations.segments):
-        for res_idx, result in enumerate(segment.generation_results):
-            if result.video.status in ("queued", "in_progress"):
-                videos_to_check.append((seg_idx, res_idx, result))
+    updated_videos: dict[tuple[int, int], GeneratedVideo] = {}
+    download_tasks: dict[tuple[int, int], asyncio.Task[str | None]] = {}
+    ready_downloads: dict[
+        tuple[int, int], tuple[str, Path, Literal["sora", "veo"], str | None]
+    ] = {}
+
+    def queue_download_if_ready(
+        seg_idx: int, res_idx: int, result: GenerationResult, video: GeneratedVideo
+    ) -> None:
+        """Queue a completed video that isn't on disk yet for download."""
+        if video.status != "completed" or not video.video_url:
+            return
+        local_path = get_video_local_path(
+            project_root, project_id, seg_idx, result.input_index, video.id
+        )
+        if local_path in existing_files:
+            return
+        ready_downloads[(seg_idx, res_idx)] = (
+            video.video_url,
+            local_path,
+            result.provider,
+            openai_api_key if result.provider == "sora" else None,
+        )
+
+    async def start_ready_downloads() -> None:
+        """Create the queued downloads' directories in one hop, then start them."""
+        if not ready_downloads:
+            return
+        await asyncio.to_thread(
+            _make_dirs, {path.parent for _, path, _, _ in ready_downloads.values()}
+        )
+        for key, (url, path, provider, api_key) in ready_downloads.items():
+            download_tasks[key] = _start_download(url, path, provider, api_key)
+        ready_downloads.clear()
+
+    status_semaphore = asyncio.Semaphore(max_concurrent_status_checks)
 
-    # Check statuses in parallel
     async def check_status(
         seg_idx: int, res_idx: int, result: GenerationResult
-    ) -> tuple[int, int, GeneratedVideo | None, str | None]:
+    ) -> tuple[int, int, GenerationResult, GeneratedVideo | None, str | None]:
         try:
-            updated_video = await service.get_status(result.provider, result.video.id)
-            return (seg_idx, res_idx, updated_video, None)
+            async with status_semaphore:
+                updated_video = await service.get_status(
+                    result.provider, result.video.id
+                )
+            return (seg_idx, res_idx, result, updated_video, None)
         except Exception as e:
-            return (seg_idx, res_idx, None, str(e))
+            return (seg_idx, res_idx, result, None, str(e))
 
-    status_tasks = [
-        check_status(seg_idx, res_idx, result)
-        for seg_idx, res_idx, result in videos_to_check
-    ]
-    status_results = await asyncio.gather(*status_tasks)
+    # Check pending videos in parallel, and note the ones already completed
+    # in the same pass
+    status_tasks = []
+    already_completed: list[tuple[int, int, GenerationResult]] = []
+    result_dirs: set[Path] = set()
+    for seg_idx, segment in enumerate(video_generations.segments):
+        for res_idx, result in enumerate(segment.generation_results):
+            status = result.video.status
+            if status == "queued" or status == "in_progress":
+                status_tasks.append(
+                    asyncio.create_task(check_status(seg_idx, res_idx, result))
+                )
+            elif status == "completed":
+                already_completed.append((seg_idx, res_idx, result))
+            if status != "failed":
+                result_dirs.add(
+                    get_video_local_path(
+                        project_root,
+                        project_id,
+                        seg_idx,
+                        result.input_index,
+                        result.video.id,
+                    ).parent
+                )
 
-    # Build a map of updated videos
-    updated_videos: dict[tuple[int, int], GeneratedVideo] = {}
-    for seg_idx, res_idx, updated_video, error in status_results:
+    # List downloaded files in one worker-thread hop while statuses load,
+    # instead of a blocking stat() per video on the event loop
+    existing_files = await asyncio.to_thread(_list_files, result_dirs)
+
+    # Videos already completed on a previous poll may still need their
+    # download (re)started; these don't wait on any status check
+    for seg_idx, res_idx, result in already_completed:
+        queue_download_if_ready(seg_idx, res_idx, result, result.video)
+    await start_ready_downloads()
+
+    # Collect statuses as they arrive, then start the newly completed
+    # downloads together so their directories are made in a single hop
+    for next_status in asyncio.as_completed(status_tasks):
+        seg_idx, res_idx, result, updated_video, error = await next_status
         if updated_video:
             updated_videos[(seg_idx, res_idx)] = updated_video
+            queue_download_if_ready(seg_idx, res_idx, result, updated_video)
         elif error:
             # Keep original video but add error
-            for s_idx, segment in enumerate(video_generations.segments):
-                if s_idx == seg_idx:
-                    original = segment.generation_results[res_idx].video
-                    updated_videos[(seg_idx, res_idx)] = original.model_copy(
-                        update={"error": f"Status check failed: {error}"}
-                    )
-
-    # Collect videos that need downloading (completed with video_url but not yet downloaded)
-    videos_to_download: list[tuple[int, int, GenerationResult, Path]] = []
-    for seg_idx, segment in enumerate(video_generations.segments):
-        for res_idx, result in enumerate(segment.generation_results):
-            # Use updated video if available, otherwise original
-            video = updated_videos.get((seg_idx, res_idx), result.video)
-            local_path = get_video_local_path(
-                project_root, project_id, seg_idx, result.input_index, video.id
+            updated_videos[(seg_idx, res_idx)] = result.video.model_copy(
+                update={"error": f"Status check failed: {error}"}
             )
-            if (
-                video.status == "completed"
-                and video.video_url
-                and not local_path.exists()
-            ):
-                videos_to_download.append((seg_idx, res_idx, result, local_path))
-
-    # Download videos in parallel
-    async def download_one(
-        seg_idx: int, res_idx: int, result: GenerationResult, local_path: Path
-    ) -> tuple[int, int, str | None]:
-        video = updated_videos.get((seg_idx, res_idx), result.video)
-        api_key = openai_api_key if result.provider == "sora" else None
-        error = await _download_video(
-            video.video_url,  # type: ignore (we checked video_url is not None)
-            local_path,
-            result.provider,
-            api_key,
-        )
-        return (seg_idx, res_idx, error)
+    await start_ready_downloads()
 
-    download_tasks = [
-        download_one(seg_idx, res_idx, result, local_path)
-        for seg_idx, res_idx, result, local_path in videos_to_download
-    ]
-    download_results = await asyncio.gather(*download_tasks)
+    # Downloads run in the background; only wait briefly so slow downloads
+    # don't hold up the poll response
+    if download_tasks:
+        await asyncio.wait(
+            set(download_tasks.values()), timeout=_DOWNLOAD_WAIT_SECONDS
+        )
 
-    # Track download errors
+    # Track download errors and downloads still running
     download_errors: dict[tuple[int, int], str] = {}
-    for seg_idx, res_idx, error in download_results:
-        if error:
-            download_errors[(seg_idx, res_idx)] = error
-
-    # Build updated VideoGenerations
-    updated_segments: list[SegmentGeneration] = []
-    for seg_idx, segment in enumerate(video_generations.segments):
-        updated_results: list[GenerationResult] = []
-        for res_idx, result in enumerate(segment.generation_results):
-            key = (seg_idx, res_idx)
-
-            # Get updated video (from status check) or original
-            video = updated_videos.get(key, result.video)
-
-            # Add download error if any
-            if key in download_errors:
-                video = video.model_copy(
-                    update={"error": f"Download failed: {download_errors[key]}"}
-                )
-
-            updated_results.append(
-                GenerationResult(
-                    input_index=result.input_index,
-                    provider=result.provider,
-                    video=video,
-                )
+    downloading: set[tuple[int, int]] = set()
+    for key, task in download_tasks.items():
+        if not task.done():
+            downloading.add(key)
+        elif error := task.result():
+            download_errors[key] = error
+
+    # Collect the videos that actually changed, by segment
+    changed: dict[int, dict[int, GeneratedVideo]] = {}
+    for key in updated_videos.keys() | downloading | download_errors.keys():
+        seg_idx, res_idx = key
+        original = video_generations.segments[seg_idx].generation_results[res_idx].video
+
+        # Get updated video (from status check) or original
+        video = updated_videos.get(key, original)
+
+        # Report as still in progress until the file is on disk, so
+        # clients don't request a video that isn't there yet
+        if key in downloading:
+            video = video.model_copy(update={"status": "in_progress", "progress": 100})
+        # Add download error if any
+        elif key in download_errors:
+            video = video.model_copy(
+                update={"error": f"Download failed: {download_errors[key]}"}
             )
 
-        # Derive segment status
-        segment_status = _derive_segment_status(updated_results)
-        updated_segments.append(
-            SegmentGeneration(
-                segment_index=segment.segment_index,
-                scene_description=segment.scene_description,
-                status=segment_status,
-                generation_results=updated_results,
+        if video != original:
+            changed.setdefault(seg_idx, {})[res_idx] = video
+
+    # Nothing changed: skip rebuilding the models
+    if not changed:
+        return video_generations
+
+    # Copy only the touched segments and results; the input is left as is
+    # so callers can diff it against the result
+    updated_segments = list(video_generations.segments)
+    for seg_idx, videos in changed.items():
+        segment = updated_segments[seg_idx]
+        updated_results = list(segment.generation_results)
+        for res_idx, video in videos.items():
+            updated_results[res_idx] = updated_results[res_idx].model_copy(
+                update={"video": video}
             )
+        updated_segments[seg_idx] = segment.model_copy(
+            update={
+                "status": _derive_segment_status(updated_results),
+                "generation_results": updated_results,
+            }
         )
 
-    # Derive overall status
-    overall_status = _derive_overall_status(updated_segments)
-
-    return VideoGenerations(
-        project_id=video_generations.project_id,
-        created_at=video_generations.created_at,
-        status=overall_status,
-        segments=updated_segments,
+    return video_generations.model_copy(
+        update={
+            "status": _derive_overall_status(updated_segments),
+            "segments": updated_segments,
+        }
     )
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Annotated, Any, Callable, List
 
 from agents import (
@@ -26,9 +27,9 @@ from chatkit.types import (
     ThreadItemDoneEvent,
 )
 from openai.types import Reasoning
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from .video_project_state import GenerationInput, Segment, VideoProjectState
+from .video_project_state import GenerationInput, ImageInput, Segment, VideoProjectState
 from .video_project_store import VideoProjectStore
 
 
@@ -58,7 +59,6 @@ class SegmentInput(BaseModel):
     )
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 INSTRUCTIONS: str = """
@@ -155,18 +155,67 @@ Example using image as reference only:
 
 MODEL = "gpt-5.2"
 
+# Gap between items created by the same tool call, so they sort in order
+_ITEM_TICK = timedelta(microseconds=1)
+
 
 class VideoAgentContext(AgentContext):
     """Agent context with access to video project store."""
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     projects: Annotated[VideoProjectStore, Field(exclude=True)]
+    # thread_id -> (store version, state) for the tool calls of this request
+    _state_cache: dict[str, tuple[int, VideoProjectState]] = PrivateAttr(
+        default_factory=dict
+    )
+
+
+def _to_segment(seg: SegmentInput) -> Segment:
+    """Convert a tool-call SegmentInput to a storyboard Segment.
+
+    SegmentInput has already validated the field types, so Segment and
+    ImageInput are built without re-validation. GenerationInput is still
+    validated because it narrows `provider` to the supported names.
+    """
+    return Segment.model_construct(
+        scene_description=seg.scene_description,
+        duration=seg.duration,
+        generation_inputs=[
+            GenerationInput(
+                provider=gi.provider,  # type: ignore[arg-type]
+                prompt=gi.prompt,
+                negative_prompt=gi.negative_prompt,
+                reference_images=[
+                    ImageInput.model_construct(file_path=path)
+                    for path in gi.reference_image_paths
+                ]
+                or None,
+                input_image=(
+                    ImageInput.model_construct(file_path=gi.input_image_path)
+                    if gi.input_image_path
+                    else None
+                ),
+            )
+            for gi in seg.generation_inputs
+        ],
+    )
 
 
 async def _get_state(ctx: RunContextWrapper[VideoAgentContext]) -> VideoProjectState:
-    """Get the current project state for this thread."""
+    """Get the current project state for this thread.
+
+    Reuses the state already loaded during this request unless the store has
+    been mutated since, so chained tool calls skip the load and clone.
+    """
     thread_id = ctx.context.thread.id
-    return await ctx.context.projects.load(thread_id)
+    projects = ctx.context.projects
+    version = projects.version(thread_id)
+    cached = ctx.context._state_cache.get(thread_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    state = await projects.load(thread_id)
+    ctx.context._state_cache[thread_id] = (version, state)
+    return state
 
 
 async def _update_state(
@@ -175,30 +224,41 @@ async def _update_state(
 ) -> VideoProjectState:
     """Update the project state and return the new state."""
     thread_id = ctx.context.thread.id
-    return await ctx.context.projects.mutate(thread_id, mutator)
+    projects = ctx.context.projects
+    state = await projects.mutate(thread_id, mutator)
+    ctx.context._state_cache[thread_id] = (projects.version(thread_id), state)
+    return state
 
 
 async def _sync_status(
     ctx: RunContextWrapper[VideoAgentContext],
     state: VideoProjectState,
     flash: str | None = None,
+    payload: dict[str, Any] | None = None,
 ) -> None:
-    """Stream a client effect to sync the project status."""
+    """Stream a client effect to sync the project status.
+
+    Pass `payload` when the caller already built it for the same state.
+    """
+    if payload is None:
+        payload = state.to_payload(ctx.context.thread.id)
     await ctx.context.stream(
         ClientEffectEvent(
             name="update_project_status",
-            data={
-                "state": state.to_payload(ctx.context.thread.id),
-                "flash": flash,
-            },
+            data={"state": payload, "flash": flash},
         )
     )
 
 
 async def _add_hidden_context(
-    ctx: RunContextWrapper[VideoAgentContext], content: str
+    ctx: RunContextWrapper[VideoAgentContext],
+    *contents: str,
+    now: datetime | None = None,
 ) -> None:
-    """Add a hidden context item for preserving action history."""
+    """Add a hidden context item for preserving action history.
+
+    Several contents are joined into one item, costing a single store write.
+    """
     thread = ctx.context.thread
     request_context = ctx.context.request_context
     await ctx.context.store.add_thread_item(
@@ -206,8 +266,8 @@ async def _add_hidden_context(
         HiddenContextItem(
             id=ctx.context.store.generate_item_id("message", thread, request_context),
             thread_id=thread.id,
-            created_at=datetime.now(),
-            content=content,
+            created_at=now or datetime.now(),
+            content="".join(contents),
         ),
         context=request_context,
     )
@@ -262,8 +322,9 @@ async def set_project_details(
             ctx.context.thread, ctx.context.request_context
         )
 
-    await _sync_status(ctx, state, f"Project updated: {state.title}")
-    return state.to_payload(ctx.context.thread.id)
+    payload = state.to_payload(ctx.context.thread.id)
+    await _sync_status(ctx, state, f"Project updated: {state.title}", payload)
+    return payload
 
 
 @function_tool(
@@ -277,60 +338,52 @@ async def create_storyboard(
     segments: List[SegmentInput],
 ):
     """Create a storyboard and display it to the user."""
-    logger.info("[TOOL CALL] create_storyboard with %d segments", len(segments))
-
-    from .video_project_state import ImageInput
-
-    storyboard_segments = [
-        Segment(
-            scene_description=seg.scene_description,
-            duration=seg.duration,
-            generation_inputs=[
-                GenerationInput(
-                    provider=gi.provider,  # type: ignore[arg-type]
-                    prompt=gi.prompt,
-                    negative_prompt=gi.negative_prompt,
-                    reference_images=(
-                        [ImageInput(file_path=path) for path in gi.reference_image_paths]
-                        if gi.reference_image_paths
-                        else None
-                    ),
-                    input_image=(
-                        ImageInput(file_path=gi.input_image_path)
-                        if gi.input_image_path
-                        else None
-                    ),
-                )
-                for gi in seg.generation_inputs
-            ],
-        )
-        for seg in segments
-    ]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[TOOL CALL] create_storyboard with %d segments", len(segments))
+
+    storyboard_segments = [_to_segment(seg) for seg in segments]
 
     def mutate(state: VideoProjectState) -> None:
         state.set_storyboard(storyboard_segments)
 
-    state = await _update_state(ctx, mutate)
-    await _add_hidden_context(
-        ctx, f"<STORYBOARD_CREATED>{len(segments)} segments</STORYBOARD_CREATED>"
+    # One clock read for both items; the reply is stamped just after the
+    # hidden context so the two keep their order in the thread
+    now = datetime.now()
+
+    # The approval request only depends on the segment count, so send it
+    # while the storyboard is stored rather than after
+    send_message = asyncio.create_task(
+        ctx.context.stream(
+            ThreadItemDoneEvent(
+                item=AssistantMessageItem(
+                    thread_id=ctx.context.thread.id,
+                    id=ctx.context.generate_id("message"),
+                    created_at=now + _ITEM_TICK,
+                    content=[
+                        AssistantMessageContent(
+                            text=f"I've created a storyboard with {len(segments)} segments. Please review and let me know if you'd like any changes, or approve to proceed with video generation."
+                        )
+                    ],
+                ),
+            )
+        )
     )
-    await _sync_status(ctx, state, f"Storyboard created with {len(segments)} segments")
-
-    # Send a message asking for approval
-    await ctx.context.stream(
-        ThreadItemDoneEvent(
-            item=AssistantMessageItem(
-                thread_id=ctx.context.thread.id,
-                id=ctx.context.generate_id("message"),
-                created_at=datetime.now(),
-                content=[
-                    AssistantMessageContent(
-                        text=f"I've created a storyboard with {len(segments)} segments. Please review and let me know if you'd like any changes, or approve to proceed with video generation."
-                    )
-                ],
+    try:
+        state = await _update_state(ctx, mutate)
+
+        # The store write is independent of the status event, so overlap them
+        await asyncio.gather(
+            _add_hidden_context(
+                ctx,
+                f"<STORYBOARD_CREATED>{len(segments)} segments</STORYBOARD_CREATED>",
+                now=now,
+            ),
+            _sync_status(
+                ctx, state, f"Storyboard created with {len(segments)} segments"
             ),
         )
-    )
+    finally:
+        await send_message
 
 
 @function_tool(
@@ -357,31 +410,7 @@ async def edit_storyboard_segment(
             "message": f"Invalid segment index {segment_index}. Storyboard has {len(state.storyboard.segments)} segments (0-{len(state.storyboard.segments) - 1}).",
         }
 
-    from .video_project_state import ImageInput
-
-    # Convert SegmentInput to Segment
-    updated_segment = Segment(
-        scene_description=segment.scene_description,
-        duration=segment.duration,
-        generation_inputs=[
-            GenerationInput(
-                provider=gi.provider,  # type: ignore[arg-type]
-                prompt=gi.prompt,
-                negative_prompt=gi.negative_prompt,
-                reference_images=(
-                    [ImageInput(file_path=path) for path in gi.reference_image_paths]
-                    if gi.reference_image_paths
-                    else None
-                ),
-                input_image=(
-                    ImageInput(file_path=gi.input_image_path)
-                    if gi.input_image_path
-                    else None
-                ),
-            )
-            for gi in segment.generation_inputs
-        ],
-    )
+    updated_segment = _to_segment(segment)
 
     def mutate(state: VideoProjectState) -> None:
         state.update_segment(segment_index, updated_segment)
@@ -414,18 +443,23 @@ async def start_video_generation(
         state.touch()
 
     state = await _update_state(ctx, mutate)
-    await _add_hidden_context(ctx, "<STORYBOARD_APPROVED></STORYBOARD_APPROVED>")
-    await _add_hidden_context(
-        ctx, "<VIDEO_GENERATION_STARTED></VIDEO_GENERATION_STARTED>"
-    )
-    await _sync_status(ctx, state, "Video generation started")
-
-    # Send client effect to frontend to trigger video generation API calls
-    await ctx.context.stream(
-        ClientEffectEvent(
-            name="start_video_generation",
-            data={"state": state.to_payload(ctx.context.thread.id)},
-        )
+    payload = state.to_payload(ctx.context.thread.id)
+
+    # The store write is independent of the client events, so overlap them
+    await asyncio.gather(
+        _add_hidden_context(
+            ctx,
+            "<STORYBOARD_APPROVED></STORYBOARD_APPROVED>",
+            "<VIDEO_GENERATION_STARTED></VIDEO_GENERATION_STARTED>",
+        ),
+        _sync_status(ctx, state, "Video generation started", payload),
+        # Send client effect to frontend to trigger video generation API calls
+        ctx.context.stream(
+            ClientEffectEvent(
+                name="start_video_generation",
+                data={"state": payload},
+            )
+        ),
     )
 
     return {
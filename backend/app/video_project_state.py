@@ -121,9 +121,8 @@ class VideoProjectState(BaseModel):
 
     def to_payload(self, thread_id: str | None = None) -> dict[str, Any]:
         """Convert state to JSON-serializable payload for frontend."""
-        payload: dict[str, Any] = self.model_dump(mode="json")
         # Convert snake_case to camelCase for frontend
-        payload = {
+        payload: dict[str, Any] = {
             "title": self.title,
             "description": self.description,
             "aspectRatio": self.aspect_ratio,
@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Callable, Dict
 
+import orjson
+
 from .video_project_state import VideoProjectState
 
 
 class VideoProjectStore:
-    """Thread-safe in-memory store for video project state."""
+    """In-memory store for video project state.
+
+    Reads and mutations never await while touching the state, so each one is
+    atomic on the event loop without a lock, and a tool's status update can
+    stream as soon as its mutation returns.
+    """
 
     def __init__(self) -> None:
         self._states: Dict[str, VideoProjectState] = {}
-        self._lock = asyncio.Lock()
+        # Bumped on every mutation; keys the serialized payload cache
+        self._versions: Dict[str, int] = {}
+        self._payload_cache: Dict[str, tuple[int, bytes]] = {}
 
     def _ensure(self, thread_id: str) -> VideoProjectState:
         """Ensure a state exists for the given thread ID."""
@@ -23,16 +31,35 @@ class VideoProjectStore:
             self._states[thread_id] = state
         return state
 
+    def payload_json(self, thread_id: str) -> bytes:
+        """Return the serialized ``{"project": ...}`` response body for a thread.
+
+        The bytes are cached until the state is next mutated, so repeated
+        reads skip both payload building and JSON encoding.
+        """
+        version = self._versions.get(thread_id)
+        cached = self._payload_cache.get(thread_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        state = self._states.get(thread_id) or VideoProjectState()
+        body = orjson.dumps({"project": state.to_payload(thread_id)})
+        if version is not None:
+            self._payload_cache[thread_id] = (version, body)
+        return body
+
+    def version(self, thread_id: str) -> int:
+        """Return a counter that changes whenever the thread's state is mutated."""
+        return self._versions.get(thread_id, 0)
+
     async def load(self, thread_id: str) -> VideoProjectState:
         """Load the state for a thread, returning a clone."""
-        async with self._lock:
-            return self._ensure(thread_id).clone()
+        return self._ensure(thread_id).clone()
 
     async def mutate(
         self, thread_id: str, mutator: Callable[[VideoProjectState], None]
     ) -> VideoProjectState:
         """Apply a mutation to the state and return a clone."""
-        async with self._lock:
-            state = self._ensure(thread_id)
-            mutator(state)
-            return state.clone()
+        state = self._ensure(thread_id)
+        mutator(state)
+        self._versions[thread_id] = self._versions.get(thread_id, 0) + 1
+        return state.clone()
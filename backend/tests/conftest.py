@@ -18,12 +18,21 @@ from app.integrations.video_generation import (
     SoraInput,
     VeoInput,
 )
+from app.integrations.video_generation.service import _build_provider
 
 
 # Configure pytest-asyncio
 pytest_plugins = ("pytest_asyncio",)
 
 
+@pytest.fixture(autouse=True)
+def clear_provider_cache():
+    """Drop process-wide cached providers so each test builds its own."""
+    _build_provider.cache_clear()
+    yield
+    _build_provider.cache_clear()
+
+
 @pytest.fixture
 def test_output_dir() -> Path:
     """Create and return the test outputs directory."""
@@ -1,16 +1,19 @@
 """Tests for video generation providers (Sora, Veo)."""
 
+import asyncio
 import os
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
-from app.integrations.video_generation import GenerationConfig, SoraInput, VeoInput
+from app.integrations.video_generation import GenerationConfig, ImageInput, SoraInput, VeoInput
 from app.integrations.video_generation.exceptions import (
     InvalidConfigurationError,
     ProviderAuthenticationError,
     VideoGenerationRequestError,
+    VideoGenerationTimeoutError,
     VideoNotFoundError,
 )
 from app.integrations.video_generation.providers.sora import SoraProvider
@@ -102,11 +105,11 @@ class TestSoraProvider:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": "video_test_001",
             "status": "queued",
             "created_at": 1705776000,
-        }
+        })
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = MagicMock()
@@ -145,12 +148,12 @@ class TestSoraProvider:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": "video_test_001",
             "status": "in_progress",
             "progress": 50,
             "created_at": 1705776000,
-        }
+        })
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = MagicMock()
@@ -165,6 +168,36 @@ class TestSoraProvider:
             assert result.status == "in_progress"
             assert result.progress == 50
 
+    @pytest.mark.asyncio
+    async def test_get_status_retries_transient_errors(self, mock_openai_api_key):
+        """Test a 503 status response is retried before giving up."""
+        provider = SoraProvider()
+
+        unavailable = MagicMock()
+        unavailable.status_code = 503
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.content = orjson.dumps({
+            "id": "video_test_001",
+            "status": "completed",
+            "progress": 100,
+            "created_at": 1705776000,
+        })
+
+        with patch("httpx.AsyncClient") as mock_client_class, patch(
+            "app.integrations.video_generation.providers.sora.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            mock_client = MagicMock()
+            mock_client.get = AsyncMock(side_effect=[unavailable, ok])
+            mock_client_class.return_value = mock_client
+
+            result = await provider.get_status("video_test_001")
+
+            assert result.status == "completed"
+            assert mock_client.get.await_count == 2
+            mock_sleep.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_get_status_not_found(self, mock_openai_api_key):
         """Test video not found error."""
@@ -183,6 +216,94 @@ class TestSoraProvider:
             with pytest.raises(VideoNotFoundError):
                 await provider.get_status("nonexistent_video")
 
+    @pytest.mark.asyncio
+    async def test_generate_with_image_path(self, mock_openai_api_key, default_config, tmp_path):
+        """Test that a local image path is read from disk and uploaded without base64."""
+        image_path = tmp_path / "frame.png"
+        image_path.write_bytes(b"fake png bytes")
+        sora_input = SoraInput(
+            prompt="Animate this frame",
+            input_image=ImageInput(path=str(image_path), mime_type="image/png"),
+        )
+        provider = SoraProvider()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"id": "video_test_001", "status": "queued"})
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.is_closed = False
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            result = await provider.generate(sora_input, default_config)
+
+        assert result.id == "video_test_001"
+        filename, content, mime_type = mock_client.post.call_args.kwargs["files"][
+            "input_reference"
+        ]
+        assert filename == "input_image.png"
+        assert content == b"fake png bytes"
+        assert mime_type == "image/png"
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_calls(self, mock_openai_api_key):
+        """Test that one pooled client serves every request."""
+        provider = SoraProvider()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({
+            "id": "video_test_001",
+            "status": "in_progress",
+            "created_at": 1705776000,
+        })
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.is_closed = False
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            await provider.get_status("video_test_001")
+            await provider.get_status("video_test_001")
+
+            assert mock_client_class.call_count == 1
+            assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_polls_coalesce(self, mock_openai_api_key):
+        """Test concurrent get_status calls for one video share a request."""
+        provider = SoraProvider()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({
+            "id": "video_test_001",
+            "status": "in_progress",
+            "created_at": 1705776000,
+        })
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.is_closed = False
+            mock_client.get = AsyncMock(side_effect=slow_get)
+            mock_client_class.return_value = mock_client
+
+            first, second = await asyncio.gather(
+                provider.get_status("video_test_001"),
+                provider.get_status("video_test_001"),
+            )
+
+            assert first.id == second.id == "video_test_001"
+            assert mock_client.get.call_count == 1
+            assert provider._inflight == {}
+
 
 class TestVeoProvider:
     """Tests for VeoProvider."""
@@ -226,6 +347,27 @@ class TestVeoProvider:
             result = provider._validate_duration(12)
             assert result == 8
 
+    def test_operations_evict_oldest_past_cap(self, mock_google_api_key):
+        """Test tracked operations are bounded and evict least recently added."""
+        with patch("app.integrations.video_generation.providers.veo.genai.Client"):
+            provider = VeoProvider()
+            provider.MAX_TRACKED_OPERATIONS = 2
+            provider._remember_operation("op1", "t1")
+            provider._remember_operation("op2", "t2")
+            provider._remember_operation("op3", "t3")
+            assert list(provider._operations) == ["op2", "op3"]
+
+    @pytest.mark.asyncio
+    async def test_build_image_from_raw_bytes(self, mock_google_api_key):
+        """Test raw image bytes are passed through without base64 decoding."""
+        with patch("app.integrations.video_generation.providers.veo.genai.Client"):
+            provider = VeoProvider()
+            image = await provider._build_image(
+                ImageInput(raw_bytes=b"\x89PNG\r\n", mime_type="image/png")
+            )
+            assert image.image_bytes == b"\x89PNG\r\n"
+            assert image.mime_type == "image/png"
+
     @pytest.mark.asyncio
     async def test_generate_success(self, mock_google_api_key, sample_veo_input, default_config):
         """Test successful video generation."""
@@ -243,6 +385,30 @@ class TestVeoProvider:
             assert result.status == "in_progress"
             assert result.has_audio is True
 
+    @pytest.mark.asyncio
+    async def test_generate_reuses_config_template(
+        self, mock_google_api_key, sample_veo_input, default_config
+    ):
+        """Test repeat requests share one validated config template."""
+        with patch("app.integrations.video_generation.providers.veo.genai.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_operation = MagicMock()
+            mock_operation.name = "operations/veo_test_001"
+            mock_client.models.generate_videos.return_value = mock_operation
+            mock_client_class.return_value = mock_client
+
+            provider = VeoProvider()
+            await provider.generate(sample_veo_input, default_config)
+            await provider.generate(
+                sample_veo_input.model_copy(update={"negative_prompt": "blurry"}),
+                default_config,
+            )
+
+            assert len(provider._config_templates) == 1
+            first, second = mock_client.models.generate_videos.call_args_list
+            assert first.kwargs["config"].negative_prompt == sample_veo_input.negative_prompt
+            assert second.kwargs["config"].negative_prompt == "blurry"
+
     @pytest.mark.asyncio
     async def test_generate_with_options(
         self, mock_google_api_key, sample_veo_input_with_options, default_config
@@ -293,6 +459,64 @@ class TestVeoProvider:
             assert result.status == "completed"
             assert result.video_url == "https://storage.googleapis.com/video.mp4"
 
+    @pytest.mark.asyncio
+    async def test_get_video_url_reuses_completed_status(self, mock_google_api_key):
+        """Test get_video_url after a completed poll doesn't hit the API again."""
+        with patch("app.integrations.video_generation.providers.veo.genai.Client") as mock_client_class:
+            mock_client = MagicMock()
+
+            mock_operation = MagicMock()
+            mock_operation.done = True
+            mock_operation.error = None
+            mock_gen_video = MagicMock()
+            mock_gen_video.video.uri = "https://storage.googleapis.com/video.mp4"
+            mock_operation.response.generated_videos = [mock_gen_video]
+
+            mock_client.operations.get.return_value = mock_operation
+            mock_client_class.return_value = mock_client
+
+            provider = VeoProvider()
+            await provider.get_status("operations/veo_test_001")
+            url = await provider.get_video_url("operations/veo_test_001")
+
+            assert url == "https://storage.googleapis.com/video.mp4"
+            assert mock_client.operations.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_status_completed_served_from_redis(self, mock_google_api_key):
+        """Test completed results are cached in redis and the client is closed."""
+        with patch("app.integrations.video_generation.providers.veo.genai.Client") as mock_client_class:
+            mock_client = MagicMock()
+
+            mock_operation = MagicMock()
+            mock_operation.done = True
+            mock_operation.error = None
+            mock_gen_video = MagicMock()
+            mock_gen_video.video.uri = "https://storage.googleapis.com/video.mp4"
+            mock_operation.response.generated_videos = [mock_gen_video]
+
+            mock_client.operations.get.return_value = mock_operation
+            mock_client_class.return_value = mock_client
+
+            store: dict[str, str] = {"veo:op:operations/veo_test_001": "2025-01-20T12:00:00Z"}
+            redis_client = MagicMock()
+            redis_client.get = AsyncMock(side_effect=lambda key: store.get(key))
+            redis_client.setex = AsyncMock(
+                side_effect=lambda key, ttl, value: store.__setitem__(key, value)
+            )
+            redis_client.aclose = AsyncMock()
+
+            provider = VeoProvider(redis_client=redis_client)
+            first = await provider.get_status("operations/veo_test_001")
+            second = await provider.get_status("operations/veo_test_001")
+
+            assert first.created_at == "2025-01-20T12:00:00Z"
+            assert second == first
+            assert mock_client.operations.get.call_count == 1
+
+            await provider.aclose()
+            redis_client.aclose.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_get_status_in_progress(self, mock_google_api_key):
         """Test getting status of in-progress video."""
@@ -331,3 +555,41 @@ class TestVeoProvider:
 
             assert result.status == "failed"
             assert result.error is not None
+
+
+class TestVideoProviderWaitForCompletion:
+    """Tests for the shared VideoProvider polling loop."""
+
+    @pytest.mark.asyncio
+    async def test_wait_backs_off_until_completed(self, mock_openai_api_key):
+        """Test that poll intervals grow and are capped at MAX_POLL_INTERVAL."""
+        provider = SoraProvider()
+        pending = MagicMock(status="in_progress")
+        done = MagicMock(status="completed")
+        provider.get_status = AsyncMock(side_effect=[pending] * 8 + [done])
+
+        with patch(
+            "app.integrations.video_generation.providers.base.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            result = await provider.wait_for_completion("video_test_001")
+
+        assert result is done
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 8
+        assert delays[0] < 1.2
+        assert delays[-1] > delays[0]
+        assert max(delays) <= provider.MAX_POLL_INTERVAL * 1.1
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self, mock_openai_api_key):
+        """Test that waiting raises once the timeout budget is spent."""
+        provider = SoraProvider()
+        provider.get_status = AsyncMock(return_value=MagicMock(status="queued"))
+
+        with patch(
+            "app.integrations.video_generation.providers.base.asyncio.sleep",
+            new_callable=AsyncMock,
+        ):
+            with pytest.raises(VideoGenerationTimeoutError):
+                await provider.wait_for_completion("video_test_001", timeout=30.0)
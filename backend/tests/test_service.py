@@ -10,7 +10,11 @@ from app.integrations.video_generation import (
     VeoInput,
     VideoGenerationService,
 )
-from app.integrations.video_generation.exceptions import ProviderNotFoundError
+from app.integrations.video_generation.exceptions import (
+    ProviderNotFoundError,
+    VideoGenerationRequestError,
+    VideoNotFoundError,
+)
 
 
 class TestVideoGenerationService:
@@ -150,6 +154,42 @@ class TestVideoGenerationService:
             assert results[1].input_index == 1
             assert results[1].provider == "veo"
 
+    @pytest.mark.asyncio
+    async def test_generate_batch_partial_failure(self, mock_all_api_keys):
+        """Test that one failing input doesn't abort the rest of the batch."""
+        service = VideoGenerationService()
+
+        mock_sora_video = GeneratedVideo(
+            id="video_sora_001",
+            status="queued",
+            created_at="2025-01-20T12:00:00Z",
+        )
+
+        with patch(
+            "app.integrations.video_generation.service.SoraProvider"
+        ) as mock_sora_class, patch(
+            "app.integrations.video_generation.service.VeoProvider"
+        ) as mock_veo_class:
+            mock_sora = MagicMock()
+            mock_sora.generate = AsyncMock(return_value=mock_sora_video)
+            mock_sora_class.return_value = mock_sora
+
+            mock_veo = MagicMock()
+            mock_veo.generate = AsyncMock(side_effect=RuntimeError("quota exceeded"))
+            mock_veo_class.return_value = mock_veo
+
+            inputs = [
+                (SoraInput(prompt="Cat walking"), 0),
+                (VeoInput(prompt="Dog running"), 1),
+            ]
+
+            results = await service.generate_batch(inputs, GenerationConfig())
+
+            assert results[0].video.status == "queued"
+            assert results[1].input_index == 1
+            assert results[1].video.status == "failed"
+            assert results[1].video.error == "quota exceeded"
+
     @pytest.mark.asyncio
     async def test_get_status_sora(self, mock_all_api_keys):
         """Test getting status for Sora video."""
@@ -199,6 +239,30 @@ class TestVideoGenerationService:
             assert result.id == "video_veo_001"
             assert result.status == "completed"
 
+    @pytest.mark.asyncio
+    async def test_get_status_terminal_is_cached(self, mock_all_api_keys):
+        """Test a completed status is served without asking the provider again."""
+        service = VideoGenerationService()
+
+        mock_video = GeneratedVideo(
+            id="video_sora_001",
+            status="completed",
+            created_at="2025-01-20T12:00:00Z",
+        )
+
+        with patch(
+            "app.integrations.video_generation.service.SoraProvider"
+        ) as mock_provider_class:
+            mock_provider = MagicMock()
+            mock_provider.get_status = AsyncMock(return_value=mock_video)
+            mock_provider_class.return_value = mock_provider
+
+            await service.get_status("sora", "video_sora_001")
+            result = await service.get_status("sora", "video_sora_001")
+
+            assert result is mock_video
+            assert mock_provider.get_status.await_count == 1
+
     @pytest.mark.asyncio
     async def test_wait_for_completion(self, mock_all_api_keys):
         """Test waiting for video completion."""
@@ -225,7 +289,7 @@ class TestVideoGenerationService:
 
             assert result.status == "completed"
             mock_provider.wait_for_completion.assert_called_once_with(
-                "video_001", 1.0, 60.0
+                "video_001", 1.0, 60.0, 30.0
             )
 
     @pytest.mark.asyncio
@@ -250,11 +314,11 @@ class TestVideoGenerationService:
             "app.integrations.video_generation.service.VeoProvider"
         ) as mock_veo_class:
             mock_sora = MagicMock()
-            mock_sora.wait_for_completion = AsyncMock(return_value=mock_sora_video)
+            mock_sora.get_status_many = AsyncMock(return_value=[mock_sora_video])
             mock_sora_class.return_value = mock_sora
 
             mock_veo = MagicMock()
-            mock_veo.wait_for_completion = AsyncMock(return_value=mock_veo_video)
+            mock_veo.get_status_many = AsyncMock(return_value=[mock_veo_video])
             mock_veo_class.return_value = mock_veo
 
             videos = [
@@ -266,6 +330,94 @@ class TestVideoGenerationService:
 
             assert len(results) == 2
             assert all(r.video.status == "completed" for r in results)
+            mock_sora.get_status_many.assert_awaited_once_with(["video_sora_001"])
+            mock_veo.get_status_many.assert_awaited_once_with(["video_veo_001"])
+
+    @pytest.mark.asyncio
+    async def test_wait_for_batch_polls_pending_together(self, mock_all_api_keys):
+        """Test each round polls all pending ids in one call and stops when done.
+
+        A lookup that hits a transient error keeps the video pending instead
+        of failing it.
+        """
+        service = VideoGenerationService()
+
+        def video(video_id: str, status: str) -> GeneratedVideo:
+            return GeneratedVideo(
+                id=video_id, status=status, created_at="2025-01-20T12:00:00Z"
+            )
+
+        with patch(
+            "app.integrations.video_generation.service.SoraProvider"
+        ) as mock_sora_class, patch(
+            "app.integrations.video_generation.service.asyncio.sleep",
+            new_callable=AsyncMock,
+        ):
+            mock_sora = MagicMock()
+            mock_sora.get_status_many = AsyncMock(
+                side_effect=[
+                    [video("v1", "completed"), video("v2", "in_progress")],
+                    [VideoGenerationRequestError("sora", status_code=503)],
+                    [video("v2", "completed")],
+                ]
+            )
+            mock_sora_class.return_value = mock_sora
+
+            results = await service.wait_for_batch(
+                [("sora", "v1", 0), ("sora", "v2", 1)]
+            )
+
+            assert [r.video.status for r in results] == ["completed", "completed"]
+            assert mock_sora.get_status_many.await_count == 3
+            assert mock_sora.get_status_many.await_args_list[1].args == (["v2"],)
+            assert mock_sora.get_status_many.await_args_list[2].args == (["v2"],)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_batch_fails_erroring_lookup_at_timeout(
+        self, mock_all_api_keys
+    ):
+        """Test a video whose lookup keeps failing transiently fails at the timeout."""
+        service = VideoGenerationService()
+
+        with patch(
+            "app.integrations.video_generation.service.SoraProvider"
+        ) as mock_sora_class:
+            mock_sora = MagicMock()
+            mock_sora.get_status_many = AsyncMock(
+                return_value=[VideoGenerationRequestError("sora", status_code=503)]
+            )
+            mock_sora_class.return_value = mock_sora
+
+            results = await service.wait_for_batch([("sora", "v1", 0)], timeout=0)
+
+            assert results[0].video.status == "failed"
+            assert "timed out" in results[0].video.error
+
+    @pytest.mark.asyncio
+    async def test_wait_for_batch_fails_unknown_video_immediately(
+        self, mock_all_api_keys
+    ):
+        """Test a lookup error that retrying can't fix fails without waiting."""
+        service = VideoGenerationService()
+
+        with patch(
+            "app.integrations.video_generation.service.SoraProvider"
+        ) as mock_sora_class, patch(
+            "app.integrations.video_generation.service.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            mock_sora = MagicMock()
+            mock_sora.get_status_many = AsyncMock(
+                return_value=[VideoNotFoundError("sora", "v1")]
+            )
+            mock_sora_class.return_value = mock_sora
+
+            results = await service.wait_for_batch([("sora", "v1", 0)])
+
+            assert results[0].video.status == "failed"
+            assert "Video not found: v1" in results[0].video.error
+            assert mock_sora.get_status_many.await_count == 1
+            mock_sleep.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_get_video_url(self, mock_all_api_keys):
@@ -303,3 +455,16 @@ class TestVideoGenerationService:
             assert provider1 is provider2
             # Provider class should only be instantiated once
             assert mock_provider_class.call_count == 1
+
+    def test_provider_shared_across_services(self, mock_all_api_keys):
+        """Test that separate service instances share one provider."""
+        with patch(
+            "app.integrations.video_generation.service.SoraProvider"
+        ) as mock_provider_class:
+            mock_provider_class.return_value = MagicMock()
+
+            provider1 = VideoGenerationService()._get_provider("sora")
+            provider2 = VideoGenerationService()._get_provider("sora")
+
+            assert provider1 is provider2
+            assert mock_provider_class.call_count == 1
@@ -4,6 +4,7 @@ import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from app.integrations.video_generation import (
@@ -14,6 +15,8 @@ from app.integrations.video_generation import (
     VideoGenerationService,
 )
 from app.tools.video_generations import (
+    _convert_project_image_to_api_input,
+    _download_video,
     generate_videos_from_project,
     get_video_local_path,
     poll_and_save_video_generations,
@@ -314,6 +317,97 @@ class TestGetVideoLocalPath:
         assert path1 == path2
 
 
+class TestConvertProjectImage:
+    """Tests for _convert_project_image_to_api_input."""
+
+    async def test_local_file_read_once(self, tmp_path):
+        """Test a reference image shared across inputs is read from disk once."""
+        image_path = tmp_path / "character.png"
+        image_path.write_bytes(b"\x89PNG\r\n")
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            first = await _convert_project_image_to_api_input(
+                ImageInput(file_path=str(image_path))
+            )
+            second = await _convert_project_image_to_api_input(
+                ImageInput(file_path=str(image_path))
+            )
+
+        assert first.raw_bytes == second.raw_bytes == b"\x89PNG\r\n"
+        assert first.mime_type == "image/png"
+        image_reads = [c for c in mock_open.call_args_list if c.args[0] == str(image_path)]
+        assert len(image_reads) == 1
+
+    async def test_missing_file_falls_back_to_path(self, tmp_path):
+        """Test an unreadable file is passed by path for the provider to report."""
+        missing = str(tmp_path / "missing.jpg")
+        image = await _convert_project_image_to_api_input(ImageInput(file_path=missing))
+        assert image.path == missing
+        assert image.raw_bytes is None
+
+
+class TestDownloadVideo:
+    """Tests for _download_video."""
+
+    async def test_resumes_partial_download(self, tmp_path):
+        """Test a leftover .part file is resumed with a Range request."""
+        output_path = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.part").write_bytes(b"abc")
+        seen_ranges = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_ranges.append(request.headers.get("Range"))
+            return httpx.Response(206, content=b"def")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch(
+            "app.tools.video_generations._get_download_client", return_value=client
+        ):
+            error = await _download_video("https://cdn.example.com/v.mp4", output_path, "veo")
+
+        assert error is None
+        assert seen_ranges == ["bytes=3-"]
+        assert output_path.read_bytes() == b"abcdef"
+        assert not (tmp_path / "video.mp4.part").exists()
+
+    async def test_full_response_overwrites_partial(self, tmp_path):
+        """Test a server that ignores the range restarts the file."""
+        output_path = tmp_path / "video.mp4"
+        (tmp_path / "video.mp4.part").write_bytes(b"stale")
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"full"))
+        )
+        with patch(
+            "app.tools.video_generations._get_download_client", return_value=client
+        ):
+            error = await _download_video("https://cdn.example.com/v.mp4", output_path, "veo")
+
+        assert error is None
+        assert output_path.read_bytes() == b"full"
+
+    async def test_unexpected_error_discards_partial_file(self, tmp_path):
+        """Test an unexpected failure is returned as an error and leaves no files."""
+        output_path = tmp_path / "video.mp4"
+
+        async def body():
+            yield b"abc"
+            raise httpx.StreamConsumed()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch(
+            "app.tools.video_generations._get_download_client", return_value=client
+        ):
+            error = await _download_video("https://cdn.example.com/v.mp4", output_path, "veo")
+
+        assert error is not None and error.startswith("Download error")
+        assert not output_path.exists()
+        assert not (tmp_path / "video.mp4.part").exists()
+
+
 class TestPollAndSaveVideoGenerations:
     """Tests for poll_and_save_video_generations function."""
 
@@ -389,6 +483,47 @@ class TestPollAndSaveVideoGenerations:
         # Verify download was attempted
         mock_download.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_poll_unchanged_returns_same_instance(
+        self, mock_all_api_keys, tmp_path
+    ):
+        """Test that a poll where nothing changed returns the input untouched."""
+        queued_video = GeneratedVideo(
+            id="veo_gen_001",
+            status="queued",
+            created_at="2025-01-20T10:30:00Z",
+            duration=8,
+        )
+        video_generations = VideoGenerations(
+            project_id="project_001",
+            created_at="2025-01-20T10:30:00Z",
+            status="in_progress",
+            segments=[
+                SegmentGeneration(
+                    segment_index=0,
+                    status="in_progress",
+                    generation_results=[
+                        GenerationResult(
+                            input_index=0, provider="veo", video=queued_video
+                        )
+                    ],
+                )
+            ],
+        )
+        mock_service = MagicMock(spec=VideoGenerationService)
+        mock_service.get_status = AsyncMock(
+            return_value=queued_video.model_copy()
+        )
+
+        result = await poll_and_save_video_generations(
+            video_generations=video_generations,
+            project_root=tmp_path,
+            service=mock_service,
+        )
+
+        assert result is video_generations
+        mock_service.get_status.assert_called_once_with("veo", "veo_gen_001")
+
     @pytest.mark.asyncio
     async def test_poll_does_not_check_already_completed(
         self, mock_all_api_keys, tmp_path
@@ -663,6 +798,76 @@ class TestPollAndSaveVideoGenerations:
         # Verify download was called only for newly completed video
         mock_download.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_poll_slow_download_reports_in_progress(
+        self, mock_all_api_keys, tmp_path
+    ):
+        """Test a slow download doesn't block the poll and isn't started twice."""
+        video_generations = VideoGenerations(
+            project_id="project_001",
+            created_at="2025-01-20T10:30:00Z",
+            status="in_progress",
+            segments=[
+                SegmentGeneration(
+                    segment_index=0,
+                    status="in_progress",
+                    generation_results=[
+                        GenerationResult(
+                            input_index=0,
+                            provider="veo",
+                            video=GeneratedVideo(
+                                id="veo_gen_001",
+                                status="queued",
+                                created_at="2025-01-20T10:30:00Z",
+                            ),
+                        )
+                    ],
+                )
+            ],
+        )
+        mock_service = MagicMock(spec=VideoGenerationService)
+        mock_service.get_status = AsyncMock(
+            return_value=GeneratedVideo(
+                id="veo_gen_001",
+                status="completed",
+                created_at="2025-01-20T10:30:00Z",
+                video_url="https://storage.example.com/video.mp4",
+            )
+        )
+        release = asyncio.Event()
+
+        async def slow_download(url, output_path, provider, api_key):
+            await release.wait()
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(b"video")
+            return None
+
+        with patch(
+            "app.tools.video_generations._DOWNLOAD_WAIT_SECONDS", 0.01
+        ), patch(
+            "app.tools.video_generations._download_video",
+            new_callable=AsyncMock,
+            side_effect=slow_download,
+        ) as mock_download:
+            first = await poll_and_save_video_generations(
+                video_generations, tmp_path, service=mock_service
+            )
+            second = await poll_and_save_video_generations(
+                first, tmp_path, service=mock_service
+            )
+            release.set()
+            await asyncio.sleep(0)
+            third = await poll_and_save_video_generations(
+                second, tmp_path, service=mock_service
+            )
+
+        video = first.segments[0].generation_results[0].video
+        assert video.status == "in_progress"
+        assert video.progress == 100
+        assert second.status == "in_progress"
+        assert third.status == "completed"
+        mock_download.assert_called_once()
+
 
 # ============================================================================
 # Real Integration Tests (no mocks)
@@ -5,4 +5,4 @@ BACKEND_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/backend"
 VENV_DIR="${BACKEND_DIR}/.venv"
 PORT="${PORT:-8000}"
 UV_PROJECT_ENVIRONMENT="${VENV_DIR}" uv sync --directory "${BACKEND_DIR}"
-exec "${VENV_DIR}/bin/python" -m uvicorn app.main:app --app-dir "${BACKEND_DIR}" --reload --port "${PORT}"
+LOG_LEVEL="${LOG_LEVEL:-INFO}" exec "${VENV_DIR}/bin/python" -m uvicorn app.main:app --app-dir "${BACKEND_DIR}" --reload --loop uvloop --http httptools --port "${PORT}"